@@ -12,6 +12,8 @@ Perfect for getting started with agent development!
 # It provides AI capabilities for question answering and task execution
 from strands import Agent
 
+from response_cache import cached_agent_call
+
 
 # ============================================================================
 # STEP 2: Create an Agent Instance
@@ -24,13 +26,17 @@ from strands import Agent
 #   - tools: Add capabilities like web search, calculations, etc.
 agent = Agent()
 
+# Answer repeated questions from a local cache instead of calling the LLM again
+ask = cached_agent_call(agent)
+
 
 # ============================================================================
 # STEP 3: Interact with Your Agent
 # ============================================================================
 # Ask the agent a question by calling it like a function
 # The agent will process the question using its LLM and return a response
-response = agent("What is AWS re:Invent? Answer in one sentence.")
+# (a repeat of an earlier question is served from the cache)
+response = ask("What is AWS re:Invent? Answer in one sentence.")
 
 
 # ============================================================================
@@ -12,6 +12,9 @@ for your use case based on performance, cost, and capabilities.
 from strands import Agent
 from strands.models import BedrockModel
 
+from bedrock_config import latency_optimized_args, shared_client_args
+from response_cache import cached_agent_call
+
 
 # ============================================================================
 # STEP 2: Configure Your Bedrock Model
@@ -24,9 +27,10 @@ from strands.models import BedrockModel
 #   - DeepSeek-R1:                 us.deepseek.r1-v1:0
 #   - OpenAI GPT OSS 120B:         openai.gpt-oss-120b-1:0
 #   - Amazon Nova Premier:         us.amazon.nova-premier-v1:0
+MODEL_ID = "us.amazon.nova-premier-v1:0"
 
 model = BedrockModel(
-    model_id="us.amazon.nova-premier-v1:0",  # Specify which model to use
+    model_id=MODEL_ID,                        # Specify which model to use
     temperature=0.3,                          # Control randomness (0.0-1.0)
                                               # Lower = more focused/deterministic
                                               # Higher = more creative/random
@@ -35,8 +39,16 @@ model = BedrockModel(
                                               # Lower = more focused vocabulary
                                               # Higher = more diverse responses
     
-    streaming=True                            # Enable real-time response streaming
+    streaming=True,                           # Enable real-time response streaming
                                               # Great for user experience!
+    
+    **latency_optimized_args(MODEL_ID),       # Latency-optimized inference
+                                              # (only for supported models
+                                              # and regions, e.g. Nova Pro
+                                              # in us-east-2)
+    
+    **shared_client_args()                    # Shared boto session and
+                                              # connection pool settings
 )
 
 
@@ -46,12 +58,17 @@ model = BedrockModel(
 # Pass your configured model to the Agent constructor
 agent = Agent(model=model)
 
+# Low-temperature answers are stable, so repeated prompts can be served
+# from a local cache (keyed by model ID, sampling settings, system prompt
+# and prompt, so changing temperature or top_p asks the model again)
+ask = cached_agent_call(agent)
+
 
 # ============================================================================
 # STEP 4: Test Your Model Configuration
 # ============================================================================
 # Ask a question that helps verify which model is being used
-response = agent("What model are you and who is your creator? Answer in one sentence.")
+response = ask("What model are you and who is your creator? Answer in one sentence.")
 
 
 # ============================================================================
@@ -60,4 +77,5 @@ response = agent("What model are you and who is your creator? Answer in one sent
 # - Try different models to compare responses and performance
 # - Adjust temperature for different use cases (factual vs creative)
 # - Use streaming=True for better user experience in interactive apps
+# - Latency-optimized inference is only requested for models in LATENCY_OPTIMIZED
 # - Check AWS Bedrock documentation for the latest available models
\ No newline at end of file
@@ -9,27 +9,33 @@ to support any model and platform.
 # ============================================================================
 # STEP 1: Import Required Libraries
 # ============================================================================
-import os
-from dotenv import load_dotenv
-
 from strands import Agent
 from strands.models.anthropic import AnthropicModel
 
+from config import get_config
+
 
 # ============================================================================
 # STEP 2: Load Environment Variables
 # ============================================================================
-# Load API keys and configuration from .env file
+# Load API keys and configuration from .env file (parsed once per process)
 # This keeps sensitive credentials out of your code
-load_dotenv()
+config = get_config()
 
 # Retrieve Anthropic API key from environment
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
+ANTHROPIC_API_KEY = config.ANTHROPIC_API_KEY
 if not ANTHROPIC_API_KEY:
     raise ValueError("Please set the ANTHROPIC_API_KEY environment variable.")
 
 # Get model ID from environment (with sensible default)
-ANTHROPIC_MODEL_ID = os.getenv("ANTHROPIC_CLAUDE_4", "claude-sonnet-4-20250514")
+ANTHROPIC_MODEL_ID = config.ANTHROPIC_MODEL_ID
+
+# Token budgets sized for a one-sentence answer (override per use case)
+# Anthropic requires a thinking budget of at least 1024 tokens, and max_tokens
+# must be larger than the thinking budget
+# (ANTHROPIC_MAX_TOKENS and ANTHROPIC_THINKING_BUDGET environment variables)
+ANTHROPIC_MAX_TOKENS = config.ANTHROPIC_MAX_TOKENS
+ANTHROPIC_THINKING_BUDGET = config.ANTHROPIC_THINKING_BUDGET
 
 
 # ============================================================================
@@ -38,6 +44,10 @@ ANTHROPIC_MODEL_ID = os.getenv("ANTHROPIC_CLAUDE_4", "claude-sonnet-4-20250514")
 # Configure the Anthropic model with extended thinking capabilities
 # Extended thinking allows the model to "think" before responding,
 # improving reasoning quality for complex tasks
+#
+# Note: Unlike BedrockModel, AnthropicModel has no streaming flag. It always
+# calls the Messages API with stream=True, and the agent's default callback
+# handler prints tokens as they arrive (low time-to-first-token)
 anthropic_model = AnthropicModel(
     # Authentication configuration
     client_args={
@@ -45,9 +55,9 @@ anthropic_model = AnthropicModel(
     },
     
     # Token budget configuration
-    # Max tokens is set to 4096 to allow for extended thinking tokens
-    # This includes both thinking tokens and response tokens
-    max_tokens=4096,
+    # Max tokens covers both thinking tokens and response tokens
+    # Fewer allowed tokens means a shorter worst-case generation time
+    max_tokens=ANTHROPIC_MAX_TOKENS,
     
     # Specify which Claude model to use
     model_id=ANTHROPIC_MODEL_ID,
@@ -63,7 +73,7 @@ anthropic_model = AnthropicModel(
         # This enables the model to use internal reasoning before responding
         "thinking": {
             "type": "enabled",
-            "budget_tokens": 1028  # Tokens allocated for thinking process
+            "budget_tokens": ANTHROPIC_THINKING_BUDGET  # Tokens allocated for thinking process
         }
     }
 )
@@ -7,34 +7,60 @@ This example demonstrates how to use OpenAI's GPT models with Strands agents.
 # ============================================================================
 # STEP 1: Import Required Libraries
 # ============================================================================
-import os
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from strands import Agent
 from strands.models.openai import OpenAIModel
 
+from config import get_config
+
 
 # ============================================================================
 # STEP 2: Load Environment Variables
 # ============================================================================
-# Load API keys from .env file
-load_dotenv()
+# Load API keys from .env file (parsed once per process)
+config = get_config()
 
 # Retrieve OpenAI API key from environment
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+OPENAI_API_KEY = config.OPENAI_API_KEY
 if not OPENAI_API_KEY:
     raise ValueError("Please set the OPENAI_API_KEY environment variable.")
 
 # Get model ID from environment (defaults to GPT-5)
-OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-5")
+OPENAI_MODEL = config.OPENAI_MODEL
 
 
 # ============================================================================
-# STEP 3: Configure OpenAI Model
+# STEP 3: Define the Structured Output Schema
+# ============================================================================
+# The shape every answer must follow
+class ModelIdentity(BaseModel):
+    # Strict JSON schemas must forbid extra keys
+    model_config = ConfigDict(extra="forbid")
+
+    model: str = Field(description="Name of the model answering")
+    creator: str = Field(description="Company or organization that created the model")
+
+
+# Build the JSON schema once and let OpenAI enforce it while decoding
+# (strict mode means the response always parses, so there are no retries)
+RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "ModelIdentity",
+        "schema": ModelIdentity.model_json_schema(),
+        "strict": True,
+    },
+}
+
+
+# ============================================================================
+# STEP 4: Configure OpenAI Model
 # ============================================================================
 # Configure the OpenAI model with your preferred settings
 # Note: Requires OPENAI_API_KEY environment variable to be set
+# Note: OpenAIModel always requests stream=True from the Chat Completions API,
+# so agent calls print tokens as they arrive without any extra flag
 openai_model = OpenAIModel(
     model_id=OPENAI_MODEL,      # Specify which GPT model to use
                                 # Options: gpt-4, gpt-4-turbo, gpt-5, etc.
@@ -42,26 +68,31 @@ openai_model = OpenAIModel(
     temperature=0.8,            # Control creativity (0.0-2.0)
                                 # Higher = more creative responses
     
-    max_tokens=150              # Limit response length
+    max_tokens=150,             # Limit response length
                                 # Helps control costs and response size
+    
+    params={"response_format": RESPONSE_FORMAT}
+                                # Native structured output (JSON schema)
 )
 
 
 # ============================================================================
-# STEP 4: Create Agent with OpenAI Model
+# STEP 5: Create Agent with OpenAI Model
 # ============================================================================
 # Create an agent using the configured OpenAI model
 agent = Agent(model=openai_model)
 
 
 # ============================================================================
-# STEP 5: Use Structured Output
+# STEP 6: Use Structured Output
 # ============================================================================
-# The structured_output method ensures responses follow a specific format
+# The response_format makes OpenAI answer with JSON matching ModelIdentity
 # This is useful when you need consistent, parseable responses
-response = agent.structured_output(
-    "What model are you and who is your creator? Answer in one sentence."
-)
+result = agent("What model are you and who is your creator? Answer in one sentence.")
+
+# Validate the JSON answer into a typed object (fast pydantic-core parsing)
+response = ModelIdentity.model_validate_json(str(result))
+print(f"\n\nModel: {response.model}\nCreator: {response.creator}")
 
 
 # ============================================================================
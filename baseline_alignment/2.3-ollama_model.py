@@ -8,27 +8,33 @@ Perfect for development, testing, or compliance reasons.
 # ============================================================================
 # STEP 1: Import Required Libraries
 # ============================================================================
-import os
-from dotenv import load_dotenv
+import threading
 
+import ollama
 from strands import Agent
 from strands.models.ollama import OllamaModel
 
+from config import get_config
+
 
 # ============================================================================
 # STEP 2: Load Configuration
 # ============================================================================
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file (parsed once per process)
+config = get_config()
 
 # Get Ollama server configuration
 # Default: http://localhost:11434 (standard Ollama installation)
-OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://localhost:11434")
+OLLAMA_HOST = config.OLLAMA_HOST
 
 # Get model ID from environment
 # Default: llama3.2:3b (a lightweight, fast model)
 # See all available models: https://ollama.com/docs/models
-OLLAMA_MODEL_ID = os.getenv("OLLAMA_MODEL_ID", "llama3.2:3b")
+OLLAMA_MODEL_ID = config.OLLAMA_MODEL_ID
+
+# How long Ollama keeps the model loaded after a request
+# Use "-1" for long-running services so the model is never unloaded
+OLLAMA_KEEP_ALIVE = config.OLLAMA_KEEP_ALIVE
 
 
 # ============================================================================
@@ -36,6 +42,8 @@ OLLAMA_MODEL_ID = os.getenv("OLLAMA_MODEL_ID", "llama3.2:3b")
 # ============================================================================
 # Create an Ollama model instance with custom configuration
 # Ollama allows you to run open-source models locally on your machine
+# Note: OllamaModel always streams from the Ollama chat endpoint, so agent
+# calls print tokens as they arrive without any extra flag
 ollama_model = OllamaModel(
     host=OLLAMA_HOST,                    # Ollama server address
                                          # Usually localhost for local development
@@ -45,7 +53,7 @@ ollama_model = OllamaModel(
     
     temperature=0.7,                     # Control randomness (0.0-1.0)
     
-    keep_alive="10m",                    # Keep model loaded in memory
+    keep_alive=OLLAMA_KEEP_ALIVE,        # Keep model loaded in memory
                                          # Improves response time for follow-up queries
     
     stop_sequences=["###", "END"],       # Tokens that signal end of response
@@ -56,6 +64,20 @@ ollama_model = OllamaModel(
 )
 
 
+# Warm up the model in the background
+# An empty prompt makes Ollama load the model into memory without generating
+# any tokens, so the first agent call doesn't pay the model-load cost
+def warm_up_model():
+    try:
+        ollama.Client(host=OLLAMA_HOST).generate(
+            model=OLLAMA_MODEL_ID, prompt="", keep_alive=OLLAMA_KEEP_ALIVE
+        )
+    except Exception as e:
+        print(f"Ollama warmup failed: {e}")
+
+threading.Thread(target=warm_up_model, daemon=True).start()
+
+
 # ============================================================================
 # STEP 4: Create Agent with Ollama Model
 # ============================================================================
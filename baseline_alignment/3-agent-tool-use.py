@@ -14,6 +14,7 @@ In this example, we create an AWS news agent that can:
 # STEP 1: Import Required Components
 # ============================================================================
 from strands import Agent
+from strands.models import BedrockModel
 
 # Import pre-built tools from strands_tools
 # These tools extend your agent's capabilities beyond just text generation
@@ -26,22 +27,34 @@ from strands_tools import http_request, use_aws, current_time
 # This agent is designed to fetch, summarize, and store AWS news
 aws_news_agent = Agent(
     # Specify the model to use
-    model="global.anthropic.claude-sonnet-4-5-20250929-v1:0",
+    # Claude Haiku is fast and inexpensive, and it is plenty for fetching and
+    # summarizing an article (switch to Sonnet for heavier reasoning tasks)
+    # cache_prompt/cache_tools add Bedrock cache points after the system prompt
+    # and the tool definitions, so this static prefix is not re-processed on
+    # every model call (lower latency and input token cost)
+    model=BedrockModel(
+        model_id="global.anthropic.claude-haiku-4-5-20251001-v1:0",
+        cache_prompt="default",
+        cache_tools="default"
+    ),
     
     # Define the agent's role and behavior through a system prompt
     # This prompt gives the agent context about its purpose and capabilities
     system_prompt="""You are an AWS news anchor specializing in creating bite sized content about
     weekly AWS news. Your expertise is reviewing the AWS weekly, writing a narrative with one sentence
-    about each news, creating a text file, and storing it on S3. The object on S3 should have 
+    about each news, creating a Markdown file, and storing it on S3. The object on S3 should have 
     the time and date of user request and should be stored in the "aws-weekly-news-renvent" bucket. 
-    eg: 15Nov_16:05UTC_aws_weekly_briefing
+    eg: 15Nov_16:05UTC_aws_weekly_briefing.md
     
-    Use the following instructions:
-    1. Use the "https://aws.amazon.com/blogs/aws/tag/week-in-review/" URL and use only the first
-    AWS Weekly Roundup article from there. 
-    2. Use PST time zone only.
-    3. Give examples when necessary.
-    4. Create the PDF file and upload it to the S3 bucket.
+    Follow this workflow:
+    1. In a single turn, request both of these tool calls (they do not depend on each other):
+       - http_request for the "https://aws.amazon.com/blogs/aws/tag/week-in-review/" URL.
+         Use only the first AWS Weekly Roundup article from there.
+       - current_time in the PST time zone (America/Los_Angeles), for the object name.
+    2. Write the narrative from the fetched article. Give examples when necessary.
+    3. Upload the narrative to the S3 bucket as a Markdown (.md) object with use_aws
+       (put_object with ContentType "text/markdown; charset=utf-8"), naming the object
+       from the time returned in step 1. Do not generate a PDF.
     
     Your goal is to help AWS users quickly understand weekly news brief.
     """,
@@ -60,11 +73,11 @@ aws_news_agent = Agent(
 # STEP 3: Invoke the Agent
 # ============================================================================
 # Ask the agent to perform its task
-# The agent will automatically:
-# 1. Use http_request to fetch the AWS blog
-# 2. Use current_time to get the timestamp
-# 3. Process and summarize the news
-# 4. Use use_aws to upload the result to S3
+# The agent will automatically follow the workflow in its system prompt:
+# 1. Use http_request to fetch the AWS blog and current_time to get the
+#    timestamp (requested in the same turn, so Strands runs them concurrently)
+# 2. Process and summarize the news (needs the fetched article)
+# 3. Use use_aws to upload the result to S3 (needs the summary and timestamp)
 response = aws_news_agent("Whats the latest AWS news?")
 
 
@@ -74,6 +87,7 @@ response = aws_news_agent("Whats the latest AWS news?")
 # 1. Agent receives your prompt
 # 2. Agent decides which tools (if any) it needs to use
 # 3. Agent calls the appropriate tools with the right parameters
+#    (independent tool calls returned in one turn are executed concurrently)
 # 4. Agent receives tool results
 # 5. Agent synthesizes the information and responds
 #
@@ -19,14 +19,21 @@ from strands import Agent
 from strands.models import BedrockModel
 from strands.tools.mcp import MCPClient
 
+from bedrock_config import latency_optimized_args, shared_client_args
+from mcp_schema_cache import list_tools_cached
+
 
 # ============================================================================
 # STEP 2: Configure Your Model
 # ============================================================================
 # Set up the Bedrock model that will power your agent
+MODEL_ID = "global.anthropic.claude-haiku-4-5-20251001-v1:0"     # Fast, efficient model
+
 model = BedrockModel(
-    model_id="global.anthropic.claude-haiku-4-5-20251001-v1:0",  # Fast, efficient model
-    streaming=True                                                # Enable streaming responses
+    model_id=MODEL_ID,
+    streaming=True,                                               # Enable streaming responses
+    **latency_optimized_args(MODEL_ID),                           # Latency-optimized inference
+    **shared_client_args()                                        # Shared boto session/pool
 )
 
 
@@ -38,15 +45,21 @@ model = BedrockModel(
 #
 # Note: The 'uvx' command is used to run Python packages without installation
 # It's similar to 'npx' in the Node.js ecosystem
+#
+# Without a version suffix, uvx reuses its cached copy of the server instead
+# of asking PyPI for the newest release on every run ('@latest' forces that
+# check). Pin an exact release (e.g. "...-mcp-server==X.Y.Z") for fully
+# reproducible startups.
+AGENTCORE_MCP_SERVER = "awslabs.amazon-bedrock-agentcore-mcp-server"
+
 mcp_client = MCPClient(
     lambda: stdio_client(
         StdioServerParameters(
             command="uvx",  # Command to run the MCP server
                            # Platform-specific: works on macOS, Linux, Windows
             
-            args=["awslabs.amazon-bedrock-agentcore-mcp-server@latest"]
+            args=[AGENTCORE_MCP_SERVER]
                            # MCP server package to run
-                           # @latest ensures you get the newest version
         )
     )
 )
@@ -60,13 +73,10 @@ mcp_client = MCPClient(
 with mcp_client:
     # Retrieve all available tools from the MCP server
     # The server exposes its capabilities as a list of tools
-    tools = mcp_client.list_tools_sync()
-    
-    # Create an agent instance
-    # Note: In production, you'd pass the model and tools to the agent
-    agent = Agent()
+    # Tool schemas are cached on disk, so warm runs skip this round-trip
+    tools = list_tools_cached(mcp_client, AGENTCORE_MCP_SERVER)
     
-    # Alternative: Create agent with model and MCP tools
+    # Create an agent with the configured model and MCP tools
     agent = Agent(model=model, tools=tools)
     
     # Invoke the agent with a question
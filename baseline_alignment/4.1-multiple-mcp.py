@@ -12,8 +12,8 @@ comprehensive answers about AWS services and their costs.
 # ============================================================================
 # STEP 1: Import Required Libraries
 # ============================================================================
-import os
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import ExitStack
 
 from strands.models import BedrockModel
 from strands import Agent
@@ -21,17 +21,21 @@ from strands.tools.mcp import MCPClient
 from strands_tools import file_read, file_write
 from mcp import stdio_client, StdioServerParameters
 
+from bedrock_config import latency_optimized_args, shared_client_args
+from config import get_config
+from mcp_schema_cache import list_tools_cached
+
 
 # ============================================================================
 # STEP 2: Load Environment Variables
 # ============================================================================
-# Load AWS credentials and configuration from .env file
-load_dotenv()
+# Load AWS credentials and configuration from .env file (parsed once per process)
+config = get_config()
 
 # AWS credentials are required to access pricing data via the pricing MCP server
-AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
-AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
-AWS_REGION = os.getenv("AWS_REGION", "us-west-2")
+AWS_ACCESS_KEY_ID = config.AWS_ACCESS_KEY_ID
+AWS_SECRET_ACCESS_KEY = config.AWS_SECRET_ACCESS_KEY
+AWS_REGION = config.AWS_REGION
 
 # Validate that required credentials are present
 if not all([AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY]):
@@ -42,9 +46,22 @@ if not all([AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY]):
 # STEP 3: Configure the Model
 # ============================================================================
 # Use Claude Sonnet for strong reasoning capabilities
+MODEL_ID = "global.anthropic.claude-sonnet-4-5-20250929-v1:0"
+
 model = BedrockModel(
-    model_id="global.anthropic.claude-sonnet-4-5-20250929-v1:0",
-    streaming=True
+    model_id=MODEL_ID,
+    streaming=True,
+    
+    # Prompt caching: add Bedrock cache points after the system prompt and
+    # after the (large) MCP tool definitions. This static prefix is resent on
+    # every model call of the agent loop, so caching it cuts time-to-first-token
+    # and input token cost. Keep SYSTEM_PROMPT free of per-run values
+    # (timestamps, IDs) or the cached prefix will never match
+    cache_prompt="default",
+    cache_tools="default",
+    
+    **latency_optimized_args(MODEL_ID),  # Latency-optimized inference (supported models/regions only)
+    **shared_client_args()               # Shared boto session and connection pool
 )
 
 # ============================================================================
@@ -75,18 +92,28 @@ AWS PRICING TOOLS (from aws-pricing-mcp-server):
 
 IMPORTANT PRICING WORKFLOW - FOLLOW EXACTLY:
   1. Use get_pricing_service_codes() to get service codes "AmazonS3" and "AmazonCloudFront"
-  2. For each service (S3 and CloudFront), use get_pricing_service_attributes() to find attributes
-  3. Use get_pricing("AmazonS3", "us-east-1") for S3 pricing
-  4. Use get_pricing("AmazonCloudFront", "us-east-1") for CloudFront pricing
-  5. Include all pricing details in your summary
+  2. In a single turn, call get_pricing_service_attributes() for both S3 and CloudFront
+  3. In a single turn, call get_pricing("AmazonS3", "us-east-1") and
+     get_pricing("AmazonCloudFront", "us-east-1")
+  4. Include all pricing details in your summary
 
 When answering questions, always use the available tools to gather accurate information. Cite
 documentation URLs when providing information.
+
+Whenever tool calls do not depend on each other's results (e.g. documentation searches and
+pricing lookups), request them together in a single turn instead of one at a time.
 """
 
 # ============================================================================
 # STEP 5: Create Multiple MCP Client Connections
 # ============================================================================
+# MCP server packages launched with 'uvx'
+# Without a version suffix, uvx reuses its cached copy of each server instead
+# of asking PyPI for the newest release on every run ('@latest' forces that
+# check). Pin exact releases (e.g. "...-mcp-server==X.Y.Z") for fully
+# reproducible startups.
+AWS_DOCS_MCP_SERVER = "awslabs.aws-documentation-mcp-server"
+AWS_PRICING_MCP_SERVER = "awslabs.aws-pricing-mcp-server"
 
 # MCP Client #1: AWS Documentation Server
 # Provides access to the complete AWS documentation library
@@ -94,7 +121,7 @@ aws_docs_mcp_client = MCPClient(
     lambda: stdio_client(
         StdioServerParameters(
             command="uvx",
-            args=["awslabs.aws-documentation-mcp-server@latest"]
+            args=[AWS_DOCS_MCP_SERVER]
         ),
     )
 )
@@ -106,7 +133,7 @@ aws_pricing_mcp_client = MCPClient(
     lambda: stdio_client(
         StdioServerParameters(
             command="uvx",
-            args=["awslabs.aws-pricing-mcp-server@latest"],
+            args=[AWS_PRICING_MCP_SERVER],
             
             # Pass AWS credentials as environment variables to the MCP server
             env={
@@ -138,19 +165,38 @@ Save the summary to static_website_aws.md
 # ============================================================================
 # STEP 7: Connect to Multiple MCP Servers and Create Agent
 # ============================================================================
-# Use context managers to handle multiple MCP connections
-# Both servers will be connected simultaneously
-with aws_docs_mcp_client, aws_pricing_mcp_client:
+# Use an ExitStack to handle multiple MCP connections
+# Both servers are started simultaneously and stopped when the block exits
+mcp_clients = [aws_docs_mcp_client, aws_pricing_mcp_client]
+
+with ExitStack() as stack, ThreadPoolExecutor(max_workers=len(mcp_clients)) as executor:
+    
+    # Start every MCP server at the same time
+    # Each 'uvx' launch may resolve and download a package, so starting them
+    # concurrently hides one server's startup behind the other's
+    start_futures = [executor.submit(client.start) for client in mcp_clients]
+    wait(start_futures)
+    for client, future in zip(mcp_clients, start_futures):
+        if future.exception() is None:
+            stack.push(client)  # Stop this server when the block exits
+    for future in start_futures:
+        future.result()         # Re-raise the first startup failure, if any
     
     # Combine tools from both MCP clients into a single tool list
     # This gives the agent access to all capabilities from both servers
-    tools = aws_docs_mcp_client.list_tools_sync() + aws_pricing_mcp_client.list_tools_sync()
+    # Each listing is a blocking round-trip to its server, so the servers
+    # are queried concurrently instead of one after the other
+    # Tool schemas are cached on disk, so warm runs skip these round-trips
+    server_specs = [AWS_DOCS_MCP_SERVER, AWS_PRICING_MCP_SERVER]
+    futures = [
+        executor.submit(list_tools_cached, client, spec)
+        for client, spec in zip(mcp_clients, server_specs)
+    ]
+    tools = [tool for future in futures for tool in future.result()]
     
-    # Display available tools for visibility
-    print(f"\nAvailable tools from MCP servers ({len(tools)}):")
-    for tool in tools:
-        print(f"  - {tool.tool_name}")
-    print()
+    # Display available tools for visibility (built up front, written once)
+    tool_list = "\n".join(f"  - {tool.tool_name}" for tool in tools)
+    print(f"\nAvailable tools from MCP servers ({len(tools)}):\n{tool_list}\n")
     
     # Create an agent with access to:
     # - File operations (file_read, file_write)
@@ -159,11 +205,13 @@ with aws_docs_mcp_client, aws_pricing_mcp_client:
     aws_agent = Agent(
         model=model,
         system_prompt=SYSTEM_PROMPT,
-        tools=[file_read, file_write, tools],  # Combine local and MCP tools
+        tools=[file_read, file_write, *tools],  # Combine local and MCP tools into one flat list
     )
     
     # Invoke the agent with our comprehensive task
     # The agent will automatically use the appropriate tools from both MCP servers
+    # Independent tool calls requested in the same turn (e.g. the S3 and
+    # CloudFront pricing lookups) are executed concurrently by Strands
     aws_agent(prompt)
 
 
@@ -173,7 +221,8 @@ with aws_docs_mcp_client, aws_pricing_mcp_client:
 # - Multiple MCP servers can be used simultaneously
 # - Tools from different servers are combined into a single tool list
 # - The agent automatically selects the right tools for each subtask
-# - Context managers ensure proper connection lifecycle for all servers
+# - An ExitStack ensures proper connection lifecycle for all servers
+# - Independent servers can be started and queried concurrently
 # - This pattern enables building highly capable, specialized agents
 #
 # Real-World Applications:
@@ -27,9 +27,14 @@ from strands.models import BedrockModel
 # STEP 2: Configure the Model
 # ============================================================================
 # Use Claude Sonnet for strong code generation capabilities
+# cache_prompt/cache_tools add Bedrock cache points after the system prompt and
+# the tool definitions, so every turn of the interactive loop reuses the cached
+# prefix instead of re-processing it (check cacheReadInputTokens in the usage)
 model = BedrockModel(
     model_id="global.anthropic.claude-sonnet-4-5-20250929-v1:0",
-    streaming=True
+    streaming=True,
+    cache_prompt="default",
+    cache_tools="default"
 )
 
 
@@ -66,6 +71,8 @@ agent = Agent(
     
     # CRITICAL: Enable hot-reloading of tools from the tools/ directory
     # This allows the agent to immediately use tools it just created!
+    # A file watcher reloads only files that change, so the directory is
+    # not rescanned on every turn
     load_tools_from_directory=True
 )
 
@@ -116,6 +123,8 @@ while True:
     # 2. Create the tool using the editor
     # 3. Load the tool automatically
     # 4. Use the tool to answer your question
+    # The same agent is reused across turns, and its default callback handler
+    # prints tokens as they stream in (no waiting for the full response)
     agent(query)
 
 
@@ -13,6 +13,9 @@ stored in an AWS Bedrock Knowledge Base.
 # ============================================================================
 # STEP 1: Import Required Components
 # ============================================================================
+import hashlib
+import os
+
 from strands import Agent
 from strands_tools import retrieve  # Tool for searching knowledge bases
 from strands.models import BedrockModel
@@ -22,9 +25,13 @@ from strands.models import BedrockModel
 # STEP 2: Configure the Model
 # ============================================================================
 # Use Claude Sonnet for strong reasoning and comprehension
+# cache_prompt adds a Bedrock cache point after the system prompt, so repeated
+# questions reuse the cached prefix instead of re-processing it
+# (check cacheReadInputTokens in the usage metrics)
 model = BedrockModel(
     model_id="global.anthropic.claude-sonnet-4-5-20250929-v1:0",
-    streaming=True
+    streaming=True,
+    cache_prompt="default"
 )
 
 
@@ -65,14 +72,72 @@ Common topics: vacation policies, benefits, leave policies, company holidays, pe
 
 
 # ============================================================================
-# STEP 5: Query the Agent
+# STEP 5: Add a Semantic Response Cache
+# ============================================================================
+# Employees ask the same questions in many different words ("vacation policy",
+# "how many days off do I get?"). A semantic cache stores each answer next to
+# an embedding of its question, and answers a close enough question from
+# Redis instead of running the agent (no retrieval, no LLM call)
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+
+# The cache name includes the KB ID and a hash of the system prompt, so
+# changing either one starts a fresh cache instead of serving stale answers
+prompt_hash = hashlib.sha256(agent_kb.system_prompt.encode()).hexdigest()[:12]
+
+try:
+    # redisvl is only needed for the cache, so a missing install just
+    # disables caching like a missing Redis server does
+    from redisvl.extensions.cache.llm import SemanticCache
+    from redisvl.utils.vectorize import BedrockTextVectorizer
+    
+    semantic_cache = SemanticCache(
+        name=f"hr_kb_{kb_id}_{prompt_hash}",
+        redis_url=REDIS_URL,
+        distance_threshold=0.1,             # Max cosine distance for a hit
+        vectorizer=BedrockTextVectorizer(model="amazon.titan-embed-text-v2:0"),
+    )
+except Exception as e:
+    # The tutorial still works without Redis, just without caching
+    print(f"⚠️  Semantic cache disabled: {e}")
+    semantic_cache = None
+
+
+def ask_hr(query: str) -> str:
+    """
+    Answer an HR question from the semantic cache, or with the agent on a miss.
+    
+    Cache errors (e.g. Redis going away mid-run) are reported and the question
+    is answered by the agent, as if there were no cache.
+    """
+    if semantic_cache:
+        try:
+            hits = semantic_cache.check(prompt=query)
+        except Exception as e:
+            print(f"⚠️  Semantic cache lookup failed: {e}")
+            hits = []
+        if hits:
+            print(hits[0]["response"])
+            return hits[0]["response"]
+    
+    answer = str(agent_kb(query))
+    
+    if semantic_cache:
+        try:
+            semantic_cache.store(prompt=query, response=answer)
+        except Exception as e:
+            print(f"⚠️  Semantic cache store failed: {e}")
+    return answer
+
+
+# ============================================================================
+# STEP 6: Query the Agent
 # ============================================================================
 # Ask a question that requires knowledge base lookup
-# The agent will:
+# On a cache miss, the agent will:
 # 1. Use the retrieve tool to search the KB
 # 2. Find relevant documents/passages
 # 3. Synthesize an answer based on the retrieved information
-response = agent_kb("What's the vacation policy of the company?")
+response = ask_hr("What's the vacation policy of the company?")
 
 
 # ============================================================================
@@ -84,6 +149,7 @@ response = agent_kb("What's the vacation policy of the company?")
 # 4. Relevant documents/passages are returned
 # 5. Agent synthesizes answer from retrieved content
 # 6. Agent cites sources from the knowledge base
+# 7. Answer is stored in the semantic cache for similar future questions
 #
 # Benefits of RAG with Knowledge Bases:
 # - Answers based on your specific documents
@@ -18,10 +18,15 @@ import os
 import sys
 import time
 import signal
+import socket
+import selectors
 import subprocess
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import psutil
+
 
 # ============================================================================
 # STEP 2: Setup Directory Paths
@@ -35,12 +40,34 @@ A2A_DIR = SCRIPT_DIR / "strands-a2a-inter-agent"
 # STEP 3: Define Helper Functions
 # ============================================================================
 
+def port_is_free(port):
+    """
+    Check whether a port is free by trying to bind to it.
+    
+    Args:
+        port: The port to check
+    
+    Returns:
+        bool: True if nothing is listening on the port
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        # Ignore connections from a previous run that are still closing
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind(("", port))
+            return True
+        except OSError:
+            return False
+
+
 def cleanup_ports():
     """
     Clean up any processes using the required ports.
     
     This ensures a clean start by killing any lingering processes
     from previous runs that might be occupying our ports.
+    Everything runs in-process (no lsof/kill subprocesses), so it works
+    the same way on macOS and Linux.
     
     Ports used:
       - 8000: HR Agent (user-facing API)
@@ -49,40 +76,124 @@ def cleanup_ports():
     """
     ports = [8000, 8001, 8002]
     
-    for port in ports:
+    # Only look for owners of ports that are actually in use
+    busy_ports = {port for port in ports if not port_is_free(port)}
+    if not busy_ports:
+        return
+    
+    # Find and kill the processes listening on the busy ports
+    for process in psutil.process_iter(["pid"]):
         try:
-            # Find processes using this port
-            result = subprocess.run(['lsof', '-ti', f':{port}'], 
-                                  capture_output=True, text=True)
-            
-            if result.stdout.strip():
-                pids = result.stdout.strip().split('\n')
-                
-                # Kill each process
-                for pid in pids:
-                    try:
-                        subprocess.run(['kill', '-9', pid], check=False)
-                        print(f"🧹 Killed process {pid} using port {port}")
-                    except:
-                        pass
-        except:
-            pass
+            for conn in process.net_connections(kind="inet"):
+                if conn.status == psutil.CONN_LISTEN and conn.laddr.port in busy_ports:
+                    process.kill()
+                    print(f"🧹 Killed process {process.pid} using port {conn.laddr.port}")
+                    break
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            # Process already exited, or belongs to another user
+            continue
 
 
-def stream_output(process, name):
+def wait_port(process, port, timeout=30):
     """
-    Stream process output in real-time for debugging.
+    Wait until a service accepts TCP connections on its port.
     
-    This function runs in a separate thread for each service,
-    capturing and displaying their output with a service label.
+    Polls the port every 100ms instead of sleeping for a fixed time, so
+    startup takes only as long as the service actually needs.
     
     Args:
-        process: The subprocess to monitor
-        name: Display name for the service (e.g., "MCP", "EMPLOYEE", "HR")
+        process: The subprocess running the service
+        port: The port the service listens on
+        timeout: Maximum number of seconds to wait
+    
+    Raises:
+        RuntimeError: If the process exits or the port isn't open in time
+    """
+    deadline = time.monotonic() + timeout
+    
+    while time.monotonic() < deadline:
+        # Fail fast if the service crashed during startup
+        if process.poll() is not None:
+            raise RuntimeError(f"Service on port {port} exited during startup")
+        
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.1)
+    
+    raise RuntimeError(f"Service on port {port} did not start within {timeout}s")
+
+
+# One selector watches the output pipes of all services, so a single
+# thread can stream everything they print
+OUTPUT_SELECTOR = selectors.DefaultSelector()
+
+
+def start_service(script, name):
+    """
+    Start a service script and register its output for streaming.
+    
+    Args:
+        script: Script file in the strands-a2a-inter-agent directory
+        name: Display name for the service output (e.g., "MCP", "HR")
+    
+    Returns:
+        The started subprocess
+    """
+    # Spawn cost: keep this call on CPython's vfork()+exec fast path, which
+    # doesn't copy the parent's page tables. Don't add preexec_fn, user/group
+    # changes or shell=True, which force a full fork of this interpreter
+    process = subprocess.Popen(
+        [sys.executable, script],
+        cwd=str(A2A_DIR),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        
+        # Unbuffered child output: lines reach us as soon as they're printed
+        # (a child writing to a pipe would otherwise buffer its output in blocks)
+        env={**os.environ, "PYTHONUNBUFFERED": "1"},
+        
+        # Don't inherit open file descriptors, and run in a separate session so
+        # Ctrl+C is handled once here and the shutdown code stops the children
+        close_fds=True,
+        start_new_session=True
+    )
+    
+    # Hand the output pipe to the shared output streaming thread
+    os.set_blocking(process.stdout.fileno(), False)
+    OUTPUT_SELECTOR.register(process.stdout, selectors.EVENT_READ, data=name)
+    
+    return process
+
+
+def stream_output():
     """
-    for line in iter(process.stdout.readline, ''):
-        if line:
-            print(f"[{name}] {line.rstrip()}")
+    Stream the output of all services in real-time for debugging.
+    
+    This function runs in a single background thread. It waits until any
+    service has output ready, reads whatever is available without blocking,
+    and prints each complete line with its service label.
+    """
+    partial_lines = {}
+    
+    while True:
+        for key, _ in OUTPUT_SELECTOR.select(timeout=0.5):
+            name = key.data
+            try:
+                chunk = os.read(key.fd, 65536)
+            except BlockingIOError:
+                continue
+            
+            # An empty read means the service closed its output (it exited)
+            if not chunk:
+                OUTPUT_SELECTOR.unregister(key.fileobj)
+                chunk = b"\n" if partial_lines.get(name) else b""
+            
+            # Print complete lines, keep any trailing partial line for later
+            *lines, partial_lines[name] = (partial_lines.get(name, b"") + chunk).split(b"\n")
+            for line in lines:
+                print(f"[{name}] {line.decode(errors='replace').rstrip()}")
 
 # ============================================================================
 # STEP 4: Main Orchestration Function
@@ -95,7 +206,7 @@ def main():
     This function:
     1. Validates environment configuration
     2. Cleans up any existing processes on required ports
-    3. Starts all three services in sequence
+    3. Starts all three services, overlapping their startup where possible
     4. Monitors their health
     5. Handles graceful shutdown
     """
@@ -114,81 +225,52 @@ def main():
     cleanup_ports()
     time.sleep(1)
     
+    # Stream the output of every service from one background thread
+    threading.Thread(target=stream_output, daemon=True).start()
+    
     # List to track all running processes
     processes = []
     
     try:
         # ====================================================================
-        # SERVICE 1: Start MCP Server (Port 8002)
+        # SERVICES 1 & 3: Start MCP Server (Port 8002) and HR Agent (Port 8000)
         # ====================================================================
         # The MCP Server provides employee data through MCP protocol
         # It's the foundation of our data layer
         print("\n🚀 Starting MCP Server (Port 8002)...")
-        mcp_process = subprocess.Popen(
-            [sys.executable, "server.py"],
-            cwd=str(A2A_DIR),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1
-        )
+        mcp_process = start_service("server.py", "MCP")
         processes.append(mcp_process)
         
-        # Start output streaming thread for real-time monitoring
-        mcp_thread = threading.Thread(target=stream_output, args=(mcp_process, "MCP"))
-        mcp_thread.daemon = True
-        mcp_thread.start()
-        
-        print("⏳ Waiting for MCP Server to start...")
-        time.sleep(5)
+        # The HR Agent is the user-facing API that delegates complex
+        # queries to the Employee Agent using A2A communication
+        # It only contacts the Employee Agent when a request arrives, so it
+        # can boot at the same time as the MCP Server
+        print("\n👥 Starting HR Agent (Port 8000)...")
+        hr_process = start_service("hr-agent.py", "HR")
+        processes.append(hr_process)
         
         # ====================================================================
         # SERVICE 2: Start Employee Agent (Port 8001)
         # ====================================================================
         # The Employee Agent connects to the MCP Server and provides
         # a higher-level interface for querying employee information
+        # It lists the MCP tools as it starts, so the MCP Server must be up first
+        print("⏳ Waiting for MCP Server to start...")
+        wait_port(mcp_process, 8002)
+        
         print("\n🤖 Starting Employee Agent (Port 8001)...")
-        employee_process = subprocess.Popen(
-            [sys.executable, "employee-agent.py"],
-            cwd=str(A2A_DIR),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1
-        )
+        employee_process = start_service("employee-agent.py", "EMPLOYEE")
         processes.append(employee_process)
         
-        # Start output streaming thread
-        employee_thread = threading.Thread(target=stream_output, args=(employee_process, "EMPLOYEE"))
-        employee_thread.daemon = True
-        employee_thread.start()
-        
-        print("⏳ Waiting for Employee Agent to start...")
-        time.sleep(5)
-        
-        # ====================================================================
-        # SERVICE 3: Start HR Agent (Port 8000)
-        # ====================================================================
-        # The HR Agent is the user-facing API that delegates complex
-        # queries to the Employee Agent using A2A communication
-        print("\n👥 Starting HR Agent (Port 8000)...")
-        hr_process = subprocess.Popen(
-            [sys.executable, "hr-agent.py"],
-            cwd=str(A2A_DIR),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1
-        )
-        processes.append(hr_process)
-        
-        # Start output streaming thread
-        hr_thread = threading.Thread(target=stream_output, args=(hr_process, "HR"))
-        hr_thread.daemon = True
-        hr_thread.start()
-        
-        print("⏳ Waiting for HR Agent to start...")
-        time.sleep(5)
+        # Wait for both agents at the same time
+        print("⏳ Waiting for Employee Agent and HR Agent to start...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(wait_port, employee_process, 8001),
+                executor.submit(wait_port, hr_process, 8000),
+            ]
+            for future in futures:
+                future.result()  # Re-raise any startup failure
         
         # ====================================================================
         # System Ready!
@@ -198,7 +280,7 @@ def main():
         print("System Architecture:")
         print("  User → HR Agent (8000) → Employee Agent (8001) → MCP Server (8002)")
         print("\nTest the system:")
-        print('  curl -X POST http://localhost:8000/inquire \\')
+        print('  curl -N -X POST http://localhost:8000/inquire \\')
         print('    -H "Content-Type: application/json" \\')
         print('    -d \'{"question": "list employees with Python skills"}\'')
         print("\nPress Ctrl+C to stop all services")
@@ -212,7 +294,7 @@ def main():
             # Check if any process has died unexpectedly
             for i, process in enumerate(processes):
                 if process.poll() is not None:
-                    service_names = ["MCP Server", "Employee Agent", "HR Agent"]
+                    service_names = ["MCP Server", "HR Agent", "Employee Agent"]
                     print(f"\n❌ {service_names[i]} has stopped unexpectedly!")
                     return
             
@@ -221,6 +303,9 @@ def main():
     except KeyboardInterrupt:
         print("\n🛑 Received interrupt signal, shutting down...")
     
+    except RuntimeError as e:
+        print(f"\n❌ {e}")
+    
     finally:
         # ====================================================================
         # Graceful Shutdown
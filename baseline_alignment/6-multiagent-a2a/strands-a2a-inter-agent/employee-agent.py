@@ -14,11 +14,17 @@ Architecture Role:
 # ============================================================================
 # STEP 1: Import Required Components
 # ============================================================================
+import atexit
+import hashlib
+import json
 import os
+from pathlib import Path
 from urllib.parse import urlparse
 
 from mcp.client.streamable_http import streamablehttp_client
+from mcp.types import Tool
 from strands import Agent
+from strands.tools.mcp import MCPAgentTool
 from strands.tools.mcp.mcp_client import MCPClient
 from strands.multiagent.a2a import A2AServer
 from strands.models import BedrockModel
@@ -38,9 +44,82 @@ EMPLOYEE_AGENT_URL = "http://localhost:8001/"
 # STEP 3: Create MCP Client Connection
 # ============================================================================
 # Connect to the MCP Server to access employee data tools
-employee_mcp_client = MCPClient(
-    lambda: streamablehttp_client(EMPLOYEE_INFO_URL)
-)
+# A single long-lived client serves every A2A request: the connection to the
+# MCP Server is opened once, on first use, and closed when the process exits
+# (never open a client per request, that repeats the handshake every time)
+_employee_mcp_client = None
+
+
+def get_employee_mcp_client():
+    """
+    Return the process-wide MCP client, connecting on first use.
+    
+    Returns:
+        MCPClient: Started client connected to EMPLOYEE_INFO_URL
+    """
+    global _employee_mcp_client
+    if _employee_mcp_client is None:
+        _employee_mcp_client = MCPClient(
+            lambda: streamablehttp_client(EMPLOYEE_INFO_URL)
+        )
+        _employee_mcp_client.start()
+        atexit.register(_employee_mcp_client.stop, None, None, None)
+    return _employee_mcp_client
+
+
+# Tool manifest cache
+# The MCP Server's tools are defined in server.py, so its modification time
+# acts as the server version: editing the tools invalidates the cache
+MCP_SERVER_SOURCE = Path(__file__).parent / "server.py"
+TOOL_CACHE_DIR = Path.home() / ".cache" / "strands"
+
+
+def list_tools_cached(client):
+    """
+    List the MCP Server's tools, reusing a cached manifest when still valid.
+    
+    A manifest that cannot be read or no longer validates is deleted and the
+    tools are listed live instead. Writing a new manifest removes the ones
+    left over from earlier versions of server.py.
+    
+    Args:
+        client: Started MCPClient connected to EMPLOYEE_INFO_URL
+    
+    Returns:
+        list: MCPAgentTool objects bound to the client
+    """
+    server_key = hashlib.sha256(EMPLOYEE_INFO_URL.encode()).hexdigest()[:16]
+    version_key = hashlib.sha256(str(MCP_SERVER_SOURCE.stat().st_mtime_ns).encode()).hexdigest()[:16]
+    cache_file = TOOL_CACHE_DIR / f"mcp_tools_{server_key}_{version_key}.json"
+    
+    # Cache hit: rebuild the tools without asking the MCP Server
+    if cache_file.exists():
+        try:
+            schemas = json.loads(cache_file.read_text())
+            return [MCPAgentTool(Tool.model_validate(schema), client) for schema in schemas]
+        except (OSError, ValueError, TypeError) as e:
+            # ValueError also covers JSON decoding and pydantic validation errors
+            print(f"⚠️  Ignoring unreadable tool manifest {cache_file}: {e}")
+            cache_file.unlink(missing_ok=True)
+    
+    # Cache miss: list the tools live and save the manifest
+    # It is written to a temporary file and renamed into place, so an
+    # interrupted write never leaves a half-written manifest behind
+    tools = client.list_tools_sync()
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        TOOL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(json.dumps([tool.mcp_tool.model_dump(mode="json") for tool in tools]))
+        tmp_file.replace(cache_file)
+        
+        # Manifests of earlier server.py versions will never be read again
+        for old_file in TOOL_CACHE_DIR.glob(f"mcp_tools_{server_key}_*.json"):
+            if old_file != cache_file:
+                old_file.unlink(missing_ok=True)
+    except (OSError, ValueError, TypeError) as e:
+        print(f"⚠️  Could not save tool manifest {cache_file}: {e}")
+        tmp_file.unlink(missing_ok=True)
+    return tools
 
 
 # ============================================================================
@@ -56,54 +135,61 @@ model = BedrockModel(
 # ============================================================================
 # STEP 5: Create Agent with MCP Tools
 # ============================================================================
-# Use context manager to ensure proper MCP connection lifecycle
-with employee_mcp_client:
-    # Retrieve all tools from the MCP Server
-    # These tools allow the agent to query employee data
-    tools = employee_mcp_client.list_tools_sync()
-    
-    print("🔧 Available MCP tools:")
-    for tool in tools:
-        print(f"   - {tool.tool_name}")
-    print()
-    
-    # Create the Employee Agent with MCP tools
-    employee_agent = Agent(
-        model=model,
-        name="Employee Agent",
-        description="Answers questions about employees",
-        tools=tools,
-        
-        # System prompt defines how the agent should respond
-        # This ensures consistent formatting across responses
-        system_prompt="you must abbreviate employee first names and list all their skills"
-    )
+# Get the shared MCP connection (opened once, kept for the whole process)
+employee_mcp_client = get_employee_mcp_client()
+
+# Retrieve all tools from the MCP Server
+# These tools allow the agent to query employee data
+# The manifest is cached, so restarts skip the tool listing round-trip
+tools = list_tools_cached(employee_mcp_client)
+
+print("🔧 Available MCP tools:")
+for tool in tools:
+    print(f"   - {tool.tool_name}")
+print()
+
+# Create the Employee Agent with MCP tools
+employee_agent = Agent(
+    model=model,
+    name="Employee Agent",
+    description="Answers questions about employees",
+    tools=tools,
     
-    # ========================================================================
-    # STEP 6: Create A2A Server
-    # ========================================================================
-    # Wrap the agent in an A2A server so other agents can call it
-    # This exposes the agent as a service that can be discovered and used
-    # by other agents in the system
-    a2a_server = A2AServer(
-        agent=employee_agent,
-        host=urlparse(EMPLOYEE_AGENT_URL).hostname,  # Extract hostname
-        port=int(urlparse(EMPLOYEE_AGENT_URL).port)  # Extract port
+    # System prompt defines how the agent should respond
+    # This ensures consistent formatting across responses
+    system_prompt=(
+        "you must abbreviate employee first names and list all their skills. "
+        "When a question combines several skills (e.g. both AWS and Docker), "
+        "use get_employees_with_all_skills in a single call instead of "
+        "calling get_employees_with_skill once per skill"
     )
+)
+
+# ============================================================================
+# STEP 6: Create A2A Server
+# ============================================================================
+# Wrap the agent in an A2A server so other agents can call it
+# This exposes the agent as a service that can be discovered and used
+# by other agents in the system
+a2a_server = A2AServer(
+    agent=employee_agent,
+    host=urlparse(EMPLOYEE_AGENT_URL).hostname,  # Extract hostname
+    port=int(urlparse(EMPLOYEE_AGENT_URL).port)  # Extract port
+)
+
+# ============================================================================
+# STEP 7: Start the A2A Server
+# ============================================================================
+if __name__ == "__main__":
+    print("🚀 Starting Employee Agent A2A Server...")
+    print(f"📍 Listening on: {EMPLOYEE_AGENT_URL}")
+    print(f"🔗 Connected to MCP Server: {EMPLOYEE_INFO_URL}")
+    print("✅ Ready to receive queries from other agents")
+    print()
     
-    # ========================================================================
-    # STEP 7: Start the A2A Server
-    # ========================================================================
-    if __name__ == "__main__":
-        print("🚀 Starting Employee Agent A2A Server...")
-        print(f"📍 Listening on: {EMPLOYEE_AGENT_URL}")
-        print(f"🔗 Connected to MCP Server: {EMPLOYEE_INFO_URL}")
-        print("✅ Ready to receive queries from other agents")
-        print()
-        
-        # Start serving A2A requests
-        # This makes the agent available for other agents to call
-        a2a_server.serve(host="0.0.0.0", port=8001)
+    # Start serving A2A requests
+    # This makes the agent available for other agents to call
+    a2a_server.serve(host="0.0.0.0", port=8001)
 
 
 # ============================================================================
@@ -111,7 +197,8 @@ with employee_mcp_client:
 # ============================================================================
 # 1. Receives A2A request from HR Agent (or other agents)
 # 2. Processes the natural language query
-# 3. Determines which MCP tools to use (get_skills, get_employees_with_skill)
+# 3. Determines which MCP tools to use (get_skills, get_employees_with_skill,
+#    get_employees_with_all_skills)
 # 4. Calls the appropriate MCP Server tools
 # 5. Synthesizes the results into a natural language response
 # 6. Returns the response via A2A protocol
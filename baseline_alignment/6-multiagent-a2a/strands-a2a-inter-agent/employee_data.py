@@ -7,9 +7,18 @@ In a real application, this would connect to a database or HR system.
 Data Structure:
 - SKILLS: Set of all possible employee skills
 - EMPLOYEES: List of employee records with names and skills
+- SKILL_TO_EMPLOYEES: Index from lowercase skill name to employee records
 """
 
 import random
+from functools import lru_cache
+
+# Optional: Numba-compiled bulk generation for large load-testing datasets
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
 
 
 # ============================================================================
@@ -31,7 +40,7 @@ LAST_NAMES = [
 # Sample Data: Skills
 # ============================================================================
 # Comprehensive set of technical skills across different domains
-SKILLS = {
+SKILLS = frozenset({
     # Programming Languages
     "Kotlin", "Java", "Python", "JavaScript", "TypeScript",
     
@@ -52,7 +61,12 @@ SKILLS = {
     
     # Specialized Skills
     "Machine Learning"
-}
+})
+
+# Skills in a fixed order for random sampling
+# (set iteration order changes between Python processes, so sampling straight
+# from SKILLS would give different employees even with a seeded generator)
+SKILLS_TUPLE = tuple(sorted(SKILLS))
 
 
 # ============================================================================
@@ -61,19 +75,104 @@ SKILLS = {
 # Create 100 unique employees with random skill combinations
 # Each employee has:
 #   - name: Full name (First Last)
-#   - skills: List of 2-5 random skills from the SKILLS set
+#   - skills: Frozenset of 2-5 random skills from the SKILLS set
+#     (a set gives O(1) "has this skill?" checks, and the skill strings are
+#     shared with SKILLS rather than copied per employee)
 #
 # Note: We use a dictionary comprehension to ensure unique names,
 # then convert to a list for easier iteration
-EMPLOYEES = list({
-    emp["name"]: emp for emp in [
-        {
-            "name": f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}",
-            "skills": random.sample(list(SKILLS), random.randint(2, 5))
-        }
-        for i in range(100)
+#
+# A seeded generator makes the dataset identical in every process (MCP server,
+# agents, tests), and the result is built only once per process
+EMPLOYEE_SEED = 42
+
+
+@lru_cache(maxsize=1)
+def _build_employees() -> list[dict]:
+    """Generate the synthetic employee records from a fixed seed."""
+    rng = random.Random(EMPLOYEE_SEED)
+    return list({
+        emp["name"]: emp for emp in [
+            {
+                "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "skills": frozenset(rng.sample(SKILLS_TUPLE, rng.randint(2, 5)))
+            }
+            for i in range(100)
+        ]
+    }.values())
+
+
+EMPLOYEES = _build_employees()
+
+
+# ============================================================================
+# Index Employees by Skill
+# ============================================================================
+# Build an inverted index once at import time, so finding everyone with a
+# skill is a single dictionary lookup instead of a scan over all employees
+# Keys are lowercase to support case-insensitive skill searches
+SKILL_TO_EMPLOYEES: dict[str, list[dict]] = {skill.lower(): [] for skill in SKILLS}
+for employee in EMPLOYEES:
+    for skill in employee["skills"]:
+        SKILL_TO_EMPLOYEES[skill.lower()].append(employee)
+
+
+# ============================================================================
+# Bulk Generation for Load Testing (Optional)
+# ============================================================================
+# generate_employees(n) builds much larger datasets (e.g. 100k employees).
+# With Numba installed, the random skill picks are made by a compiled loop
+# that returns a small-integer matrix, and Python objects are only created at
+# the end. cache=True stores the compiled code on disk, so only the very first
+# run pays the compile time.
+# The compiled loop draws from NumPy's generator rather than random.Random, so
+# a dataset is only reproducible on machines with the same backend.
+if numba is not None:
+    @numba.njit(cache=True)
+    def _skill_matrix(n, n_skills, seed):
+        """Pick 2-5 distinct skill indices per employee (-1 marks unused slots)."""
+        np.random.seed(seed)
+        out = np.full((n, 5), -1, dtype=np.int8)
+        for i in range(n):
+            k = np.random.randint(2, 6)
+            out[i, :k] = np.random.choice(n_skills, k, replace=False).astype(np.int8)
+        return out
+
+
+def generate_employees(n: int, seed: int = EMPLOYEE_SEED) -> list[dict]:
+    """
+    Generate a large synthetic employee dataset.
+    
+    Unlike EMPLOYEES, names are not deduplicated (there are only 100 possible
+    first/last name pairs), so each record also gets a unique "id".
+    
+    Args:
+        n (int): Number of employees to generate
+        seed (int): Random seed; with the same backend, the same seed gives
+            the same dataset. The Numba and pure-Python paths use different
+            random generators, so they assign different skills for the same
+            seed (names and ids are the same either way)
+    
+    Returns:
+        list[dict]: Employee records with id, name and skills
+    """
+    rng = random.Random(seed)
+    names = [f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}" for _ in range(n)]
+    
+    if numba is not None:
+        skill_rows = [
+            frozenset(SKILLS_TUPLE[index] for index in row if index >= 0)
+            for row in _skill_matrix(n, len(SKILLS_TUPLE), seed).tolist()
+        ]
+    else:
+        skill_rows = [
+            frozenset(rng.sample(SKILLS_TUPLE, rng.randint(2, 5))) for _ in range(n)
+        ]
+    
+    return [
+        {"id": i, "name": name, "skills": skills}
+        for i, (name, skills) in enumerate(zip(names, skill_rows))
     ]
-}.values())
 
 
 # ============================================================================
@@ -81,7 +180,7 @@ EMPLOYEES = list({
 # ============================================================================
 # Total unique skills: 20
 # Total employees: ~100 (may be slightly less due to duplicate name removal)
-# Skills per employee: 2-5 (randomly assigned)
+# Skills per employee: 2-5 (randomly assigned, same for every run)
 #
 # In Production:
 # - Replace this with database queries
@@ -15,30 +15,81 @@ Architecture Role:
 # STEP 1: Import Required Components
 # ============================================================================
 import os
+import sys
+import time
+from contextlib import asynccontextmanager
+
+import httpx
+import orjson
 import uvicorn
-from fastapi import FastAPI
-from fastapi.responses import StreamingResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
 from strands import Agent
 from strands.models import BedrockModel
-from strands_tools.a2a_client import A2AClientToolProvider
 
 
 # ============================================================================
 # STEP 2: Configure Service URLs
 # ============================================================================
 # URL of the Employee Agent that this agent will delegate to
-EMPLOYEE_AGENT_URL = "http://localhost:8001/"
+# Set EMPLOYEE_AGENT_URL to reach an Employee Agent running elsewhere
+EMPLOYEE_AGENT_URL = os.getenv("EMPLOYEE_AGENT_URL", "http://localhost:8001/")
+
+# Number of server worker processes
+# Requests mostly wait on Bedrock and the Employee Agent, so several worker
+# processes (one event loop each) serve many more users than a single one
+HR_AGENT_WORKERS = int(os.getenv("HR_AGENT_WORKERS", os.cpu_count() or 1))
+
+# Streamed tokens are coalesced into one SSE event once this many characters
+# are buffered, or once this many seconds have passed since the last event
+STREAM_FLUSH_CHARS = 48
+STREAM_FLUSH_SECONDS = 0.015
 
 
 # ============================================================================
 # STEP 3: Initialize FastAPI Application
 # ============================================================================
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create shared resources once, when the server starts.
+    
+    The A2A client tool provider discovers the Employee Agent and caches its
+    agent card, so requests reuse it instead of repeating discovery every
+    time.
+    """
+    # Imported here rather than at the top: the A2A client pulls in the whole
+    # a2a SDK, which is only needed once the server starts serving
+    from strands_tools.a2a_client import A2AClientToolProvider
+    
+    # Create A2A client tool provider
+    # This discovers and wraps the Employee Agent as a tool
+    # The HR Agent can now call the Employee Agent like any other tool
+    app.state.a2a_provider = A2AClientToolProvider(
+        known_agent_urls=[EMPLOYEE_AGENT_URL],
+        
+        # Settings for the HTTP clients the provider creates: it opens a
+        # fresh httpx client for every A2A operation (so it works across
+        # event loops), which means connections are not shared between
+        # calls or requests; these args only configure each of those
+        # clients. A dead agent fails fast on connect, and slow agent
+        # answers still have time to finish
+        # (httpx_client_args needs strands-agents-tools 0.2.15 or later)
+        httpx_client_args={
+            "timeout": httpx.Timeout(300.0, connect=5.0)
+        }
+    )
+    yield
+
+
 # Create a REST API for receiving user queries
 app = FastAPI(
     title="HR Agent API",
-    description="User-facing HR assistant with A2A delegation capabilities"
+    description="User-facing HR assistant with A2A delegation capabilities",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 
@@ -58,15 +109,25 @@ class QuestionRequest(BaseModel):
 # ============================================================================
 # STEP 5: Health Check Endpoint
 # ============================================================================
+# The health response never changes, so its body is serialized only once
+HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
+
 @app.get("/health")
 def health_check():
     """
     Health check endpoint for monitoring.
     
+    Monitors polling the endpoint may reuse the answer for 10 seconds.
+    
     Returns:
-        dict: Status indicating the service is healthy
+        Response: JSON status indicating the service is healthy
     """
-    return {"status": "healthy"}
+    return Response(
+        content=HEALTH_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "max-age=10"}
+    )
 
 
 # ============================================================================
@@ -82,22 +143,39 @@ model = BedrockModel(
 # ============================================================================
 # STEP 7: Main Query Endpoint with A2A Delegation
 # ============================================================================
+def sse_event(payload: dict) -> bytes:
+    """
+    Frame a payload as one Server-Sent Event.
+    
+    orjson serializes straight to bytes, which is what the stream sends,
+    and is much faster than json.dumps for the many small token events.
+    
+    Args:
+        payload (dict): Data to send, e.g. {"token": "..."}
+        
+    Returns:
+        bytes: The event, e.g. b'data: {"token": "..."}\\n\\n'
+    """
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
 @app.post("/inquire")
-async def ask_agent(request: QuestionRequest):
+async def ask_agent(request: QuestionRequest, http_request: Request):
     """
     Main endpoint for processing user questions.
     
     This endpoint:
     1. Receives a user question
-    2. Creates an agent with A2A capabilities
+    2. Creates an agent with the shared A2A tools
     3. The agent automatically delegates to Employee Agent when needed
-    4. Streams the response back to the user
+    4. Streams the response back to the user as Server-Sent Events
     
     Args:
         request (QuestionRequest): User's question
+        http_request (Request): Incoming request (gives access to app state)
         
     Returns:
-        StreamingResponse: Streamed text response from the agent
+        StreamingResponse: Server-Sent Events stream of the agent's response
     """
     
     async def generate():
@@ -105,20 +183,18 @@ async def ask_agent(request: QuestionRequest):
         Generator function for streaming responses.
         
         This function:
-        1. Sets up A2A client tools for the Employee Agent
-        2. Creates an agent with those tools
-        3. Streams the agent's response
+        1. Creates an HR Agent with the shared A2A tools
+        2. Streams the agent's response
+        3. Closes the stream, even if the client disconnects early
         """
         
-        # Create A2A client tool provider
-        # This discovers and wraps the Employee Agent as a tool
-        # The HR Agent can now call the Employee Agent like any other tool
-        provider = A2AClientToolProvider(
-            known_agent_urls=[EMPLOYEE_AGENT_URL]
-        )
+        # Reuse the A2A client tool provider created at startup
+        provider = http_request.app.state.a2a_provider
         
-        # Create the HR Agent with A2A tools
+        # Create an HR Agent with A2A tools
         # The agent will automatically decide when to delegate to Employee Agent
+        # An agent keeps conversation history, metrics and state, so each
+        # request gets a fresh one; building it is cheap next to a Bedrock call
         agent = Agent(
             model=model,
             tools=provider.tools  # A2A tools for calling Employee Agent
@@ -128,15 +204,51 @@ async def ask_agent(request: QuestionRequest):
         # The agent may call the Employee Agent multiple times during processing
         stream_response = agent.stream_async(request.question)
         
-        # Yield each chunk of the response as it's generated
-        async for event in stream_response:
-            if "data" in event:
-                yield event["data"]
+        try:
+            # Yield the response in small chunks as it's generated
+            # Bedrock sends a few characters per delta; sending each one as its
+            # own event costs a write per token, so deltas are buffered and
+            # sent together, still quickly enough to look live to the user
+            # Each chunk is sent as an SSE event: data: {"token": "..."}
+            buffer = []
+            buffered_chars = 0
+            last_flush = time.monotonic()
+            async for event in stream_response:
+                if "data" in event:
+                    buffer.append(event["data"])
+                    buffered_chars += len(event["data"])
+                
+                if buffer and (
+                    buffered_chars >= STREAM_FLUSH_CHARS
+                    or time.monotonic() - last_flush >= STREAM_FLUSH_SECONDS
+                ):
+                    yield sse_event({"token": "".join(buffer)})
+                    buffer = []
+                    buffered_chars = 0
+                    last_flush = time.monotonic()
+            
+            # Send whatever is left of the answer
+            if buffer:
+                yield sse_event({"token": "".join(buffer)})
+            
+            # Tell the client the answer is complete
+            yield sse_event({"done": True})
+        finally:
+            # Stop the agent's run if the client went away mid-answer, so it
+            # does not keep calling Bedrock and the Employee Agent for nobody
+            await stream_response.aclose()
     
-    # Return a streaming response to the client
+    # Return a Server-Sent Events stream to the client
+    # The headers stop proxies (e.g. nginx, load balancers) and browsers from
+    # buffering the stream, so every token is delivered as soon as it exists
     return StreamingResponse(
         generate(),
-        media_type="text/plain"
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            "Connection": "keep-alive"
+        }
     )
 
 
@@ -145,7 +257,7 @@ async def ask_agent(request: QuestionRequest):
 # ============================================================================
 if __name__ == "__main__":
     print("🚀 Starting HR Agent API Server...")
-    print(f"📍 Listening on: http://0.0.0.0:8000")
+    print(f"📍 Listening on: http://0.0.0.0:8000 ({HR_AGENT_WORKERS} workers)")
     print(f"🔗 Connected to Employee Agent: {EMPLOYEE_AGENT_URL}")
     print()
     print("📋 Available endpoints:")
@@ -153,15 +265,35 @@ if __name__ == "__main__":
     print("   POST /inquire - Ask HR questions")
     print()
     print("💡 Example request:")
-    print('   curl -X POST http://localhost:8000/inquire \\')
+    print('   curl -N -X POST http://localhost:8000/inquire \\')
     print('     -H "Content-Type: application/json" \\')
     print('     -d \'{"question": "List employees with Python skills"}\'')
     print()
     print("✅ Ready to receive requests")
     print()
     
-    # Start the FastAPI server
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Start the FastAPI server with multiple worker processes
+    # Multiple workers need the app as an import string ("module:attribute")
+    # Each worker runs the lifespan handler, so every worker gets its own A2A
+    # provider and connection pool on its own event loop
+    #
+    # The event loop (uvloop) and HTTP parser (httptools) are requested
+    # explicitly, so a missing compiled package fails at startup instead of
+    # silently falling back to the slower pure-Python implementations
+    # (uvloop doesn't support Windows, where the standard asyncio loop is used)
+    #
+    # Equivalent Gunicorn deployment:
+    #   gunicorn hr-agent:app -k uvicorn.workers.UvicornWorker -w 4 \
+    #     -b 0.0.0.0:8000 --keep-alive 75 --timeout 120
+    uvicorn.run(
+        "hr-agent:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=HR_AGENT_WORKERS,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        timeout_keep_alive=75
+    )
 
 
 # ============================================================================
@@ -174,7 +306,7 @@ if __name__ == "__main__":
 # 5. Employee Agent queries MCP Server for data
 # 6. Employee Agent returns results to HR Agent
 # 7. HR Agent synthesizes final response
-# 8. Response is streamed back to user
+# 8. Response is streamed back to user (Server-Sent Events)
 #
 # Benefits of This Architecture:
 # - Separation of concerns (HR logic vs Employee data logic)
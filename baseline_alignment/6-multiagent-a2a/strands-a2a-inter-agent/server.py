@@ -12,8 +12,24 @@ just pure data access functions exposed as MCP tools.
 # ============================================================================
 # STEP 1: Import Required Components
 # ============================================================================
+import hashlib
+import json
+import logging
+import os
+from functools import lru_cache
+
 from mcp.server.fastmcp import FastMCP
-from employee_data import SKILLS, EMPLOYEES
+from mcp.types import TextContent
+from starlette.requests import Request
+from starlette.responses import Response
+from employee_data import SKILLS_TUPLE, SKILL_TO_EMPLOYEES
+
+
+# Tool calls are logged at DEBUG level, which is off by default so the
+# tools don't write to the console on every call
+# Set EMPLOYEE_SERVER_LOG_LEVEL=DEBUG to trace tool calls during development
+log = logging.getLogger("employee_server")
+log.setLevel(os.getenv("EMPLOYEE_SERVER_LOG_LEVEL", "WARNING").upper())
 
 
 # ============================================================================
@@ -31,8 +47,17 @@ mcp = FastMCP("employee-server", stateless_http=True, host="0.0.0.0", port=8002)
 # ============================================================================
 # Tools are functions that agents can call to access data or functionality
 
-@mcp.tool()
-def get_skills() -> set[str]:
+# The skill list never changes while the server runs, so its JSON response
+# is built once here instead of serializing the skills on every call
+SKILLS_JSON = json.dumps(SKILLS_TUPLE)
+SKILLS_RESPONSE = TextContent(type="text", text=SKILLS_JSON)
+
+# Version tag of the skill list for HTTP caching (see the /skills endpoint)
+SKILLS_ETAG = f'"{hashlib.blake2b(SKILLS_JSON.encode(), digest_size=8).hexdigest()}"'
+
+
+@mcp.tool(structured_output=False)
+def get_skills() -> TextContent:
     """
     Get all available skills in the employee database.
     
@@ -41,14 +66,40 @@ def get_skills() -> set[str]:
     the skill taxonomy.
     
     Returns:
-        set[str]: Set of all unique skills in the database
+        TextContent: JSON array of all unique skills in the database,
+            sorted alphabetically
     """
-    print("🔍 Tool called: get_skills")
-    return SKILLS
+    log.debug("🔍 Tool called: get_skills")
+    return SKILLS_RESPONSE
 
 
-@mcp.tool()
-def get_employees_with_skill(skill: str) -> list[dict]:
+@lru_cache(maxsize=256)
+def _skill_response(skill_key: str) -> TextContent:
+    """
+    Build the JSON response for one skill, once per skill.
+    
+    The employee data never changes while the server runs, so repeated
+    questions about the same skill reuse the serialized response.
+    
+    Args:
+        skill_key (str): Lowercase skill name
+    
+    Returns:
+        TextContent: JSON array of the employees with the skill
+    
+    Raises:
+        KeyError: If no employees have the skill (not cached)
+    """
+    employees_with_skill = SKILL_TO_EMPLOYEES.get(skill_key)
+    if not employees_with_skill:
+        raise KeyError(skill_key)
+    
+    # Skill sets are written as sorted JSON arrays
+    return TextContent(type="text", text=json.dumps(employees_with_skill, default=sorted))
+
+
+@mcp.tool(structured_output=False)
+def get_employees_with_skill(skill: str) -> TextContent:
     """
     Find all employees who have a specific skill.
     
@@ -59,39 +110,107 @@ def get_employees_with_skill(skill: str) -> list[dict]:
         skill (str): The skill to search for (e.g., "Python", "AWS", "React")
     
     Returns:
-        list[dict]: List of employees with the skill, each containing:
+        TextContent: JSON array of employees with the skill, each containing:
             - name: Full name (First Last)
             - skills: List of all skills the employee has
     
     Raises:
         ValueError: If no employees have the specified skill
     """
-    print(f"🔍 Tool called: get_employees_with_skill(skill='{skill}')")
+    log.debug("🔍 Tool called: get_employees_with_skill(skill='%s')", skill)
     
-    # Perform case-insensitive skill search
-    skill_lower = skill.lower()
-    employees_with_skill = [
-        employee for employee in EMPLOYEES 
-        if any(s.lower() == skill_lower for s in employee["skills"])
+    # Perform case-insensitive skill search using the prebuilt skill index,
+    # reusing the cached response for skills that were asked about before
+    try:
+        return _skill_response(skill.lower())
+    except KeyError:
+        # Validate that we found at least one employee
+        raise ValueError(f"No employees have the '{skill}' skill") from None
+
+
+@mcp.tool()
+def get_employees_with_all_skills(skills: list[str]) -> list[dict]:
+    """
+    Find all employees who have every one of the given skills.
+    
+    Use this for queries that combine skills (e.g., "knows both AWS and
+    Docker") instead of calling get_employees_with_skill once per skill.
+    The search is case-insensitive.
+    
+    Args:
+        skills (list[str]): The skills employees must all have
+            (e.g., ["AWS", "Docker"])
+    
+    Returns:
+        list[dict]: List of employees with all the skills, each containing:
+            - name: Full name (First Last)
+            - skills: Set of all skills the employee has
+    
+    Raises:
+        ValueError: If no skills are given or no employee has all of them
+    """
+    log.debug("🔍 Tool called: get_employees_with_all_skills(skills=%s)", skills)
+    
+    if not skills:
+        raise ValueError("At least one skill is required")
+    
+    # Look up each skill in the prebuilt skill index
+    matches = [SKILL_TO_EMPLOYEES.get(skill.lower(), []) for skill in skills]
+    
+    # Intersect the matches, walking only the smallest group of employees
+    smallest = min(matches, key=len)
+    others = [{id(employee) for employee in group} for group in matches if group is not smallest]
+    employees_with_all_skills = [
+        employee for employee in smallest
+        if all(id(employee) in group for group in others)
     ]
     
     # Validate that we found at least one employee
-    if not employees_with_skill:
-        raise ValueError(f"No employees have the '{skill}' skill")
+    if not employees_with_all_skills:
+        raise ValueError(f"No employees have all of these skills: {', '.join(skills)}")
+    
+    return employees_with_all_skills
+
+
+# Plain HTTP endpoint for the skill list, next to the MCP endpoint (/mcp)
+# Clients that poll it send back the ETag they already have and get an empty
+# "304 Not Modified" response instead of the full list
+@mcp.custom_route("/skills", methods=["GET"])
+async def skills_endpoint(request: Request) -> Response:
+    """
+    Return all available skills as JSON, with HTTP caching headers.
+    
+    Args:
+        request (Request): Incoming HTTP request
+    
+    Returns:
+        Response: 304 if the client's If-None-Match matches SKILLS_ETAG,
+            otherwise the JSON skill list
+    """
+    headers = {"ETag": SKILLS_ETAG, "Cache-Control": "max-age=300"}
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if SKILLS_ETAG in (tag.strip() for tag in if_none_match.split(",")) or if_none_match == "*":
+        return Response(status_code=304, headers=headers)
     
-    return employees_with_skill
+    return Response(content=SKILLS_JSON, media_type="application/json", headers=headers)
 
 
 # ============================================================================
 # STEP 4: Run the Server
 # ============================================================================
 if __name__ == "__main__":
+    # Show tool-call log messages (when enabled) as plain console lines
+    logging.basicConfig(format="%(message)s")
+    
     # Start the MCP server using streamable HTTP transport
     # This allows agents to connect and call our tools
     print("🚀 Starting Employee MCP Server on port 8002...")
     print("📋 Available tools:")
     print("   - get_skills(): Get all available skills")
     print("   - get_employees_with_skill(skill): Find employees by skill")
+    print("   - get_employees_with_all_skills(skills): Find employees with every skill")
+    print("🌐 HTTP endpoint: GET /skills (cacheable skill list)")
     print()
     
     mcp.run(transport="streamable-http")
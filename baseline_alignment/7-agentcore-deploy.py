@@ -17,9 +17,11 @@ This example deploys an HR assistant agent to AgentCore.
 # ============================================================================
 # STEP 1: Import Required Components
 # ============================================================================
-from strands import Agent
-from strands_tools import retrieve, http_request
-from strands.models import BedrockModel
+# Only the AgentCore app is imported at startup; the Strands SDK and tools
+# are imported in create_agent() on the first request (see STEP 5), so the
+# runtime answers health checks sooner after a cold start
+import threading
+
 from bedrock_agentcore import BedrockAgentCoreApp
 
 
@@ -31,6 +33,9 @@ from bedrock_agentcore import BedrockAgentCoreApp
 # The agent is created once and reused for subsequent requests
 agent = None
 
+# Guards agent creation, so concurrent first requests build only one agent
+_agent_lock = threading.Lock()
+
 # Initialize the Bedrock AgentCore application
 # This is the main application object that handles deployment
 app = BedrockAgentCoreApp()
@@ -41,10 +46,8 @@ app = BedrockAgentCoreApp()
 # ============================================================================
 # Use Claude Haiku for fast, cost-effective responses
 # Haiku is ideal for production workloads with high request volumes
-model = BedrockModel(
-    model_id="global.anthropic.claude-haiku-4-5-20251001-v1:0",
-    streaming=True  # Enable streaming for better user experience
-)
+# The BedrockModel itself is created together with the agent in create_agent()
+MODEL_ID = "global.anthropic.claude-haiku-4-5-20251001-v1:0"
 
 
 # ============================================================================
@@ -78,16 +81,37 @@ def create_agent():
     This pattern ensures the agent is only created once and reused
     across multiple invocations, reducing cold start times and
     improving response latency.
+    
+    The Strands imports live here too: they load a lot of code and set up
+    boto3 clients, which would otherwise delay startup of the runtime.
+    
+    Creation is double-checked under a lock: requests arriving together
+    after a cold start wait for the first one to build the agent instead
+    of each building their own.
     """
     global agent
     
-    # Only create the agent if it doesn't exist yet
-    if agent is None:
-        agent = Agent(
-            model=model,
-            tools=[retrieve, http_request],
-            system_prompt=system_prompt
-        )
+    # Fast path: the agent already exists (no locking needed)
+    if agent is not None:
+        return agent
+    
+    with _agent_lock:
+        # Only create the agent if another request didn't just create it
+        if agent is None:
+            from strands import Agent
+            from strands.models import BedrockModel
+            from strands_tools import retrieve, http_request
+            
+            model = BedrockModel(
+                model_id=MODEL_ID,
+                streaming=True  # Enable streaming for better user experience
+            )
+            
+            agent = Agent(
+                model=model,
+                tools=[retrieve, http_request],
+                system_prompt=system_prompt
+            )
     
     return agent
 
@@ -122,9 +146,14 @@ def invoke(payload):
     result = agent(prompt)
     
     # Extract and return the response text
-    return {
-        "response": result.message.get('content', [{}])[0].get('text', str(result))
-    }
+    # The text is normally the first content block of the message; fall back
+    # to the full result text if the message has another shape
+    try:
+        text = result.message["content"][0]["text"]
+    except (KeyError, IndexError, TypeError):
+        text = str(result)
+    
+    return {"response": text}
 
 
 # ============================================================================
@@ -0,0 +1,81 @@
+"""
+Shared Bedrock Model Settings
+=============================
+Helpers shared by the tutorials that construct a BedrockModel.
+
+Latency-optimized inference is requested through the top-level
+`performanceConfig` field of the Converse API. Strands forwards
+`additional_args` to the top level of the request, whereas
+`additional_request_fields` would nest it under `additionalModelRequestFields`
+(which Nova models reject).
+
+All BedrockModel instances in a process can also share one boto3 session and
+client configuration, so credentials are resolved once and every client gets
+the same connection pool size and retry behaviour.
+"""
+
+import boto3
+from botocore.config import Config
+
+
+# ============================================================================
+# Latency-Optimized Inference
+# ============================================================================
+# Bedrock offers latency-optimized inference for only a few models, through
+# their US cross-region inference profiles, and only in these regions
+# Any other model or region (including the tutorials' defaults) uses
+# standard inference, since sending performanceConfig there fails the request
+LATENCY_OPTIMIZED_MODELS = {
+    "us.anthropic.claude-3-5-haiku-20241022-v1:0",
+    "us.amazon.nova-pro-v1:0",
+    "us.meta.llama3-1-70b-instruct-v1:0",
+    "us.meta.llama3-1-405b-instruct-v1:0",
+}
+LATENCY_OPTIMIZED_REGIONS = {"us-east-2"}
+
+# Region BedrockModel uses when neither the session nor AWS_REGION sets one
+DEFAULT_REGION = "us-west-2"
+
+
+def latency_optimized_args(model_id: str, region_name: str = None) -> dict:
+    """
+    Build BedrockModel keyword arguments that enable latency-optimized inference.
+
+    Args:
+        model_id (str): Bedrock model ID the agent will use
+        region_name (str): Region the model is called in (defaults to the
+            region of the shared boto session)
+
+    Returns:
+        dict: `additional_args` for supported models in supported regions,
+            otherwise an empty dict
+    """
+    region_name = region_name or BOTO_SESSION.region_name or DEFAULT_REGION
+    if model_id in LATENCY_OPTIMIZED_MODELS and region_name in LATENCY_OPTIMIZED_REGIONS:
+        return {"additional_args": {"performanceConfig": {"latency": "optimized"}}}
+    return {}
+
+
+# ============================================================================
+# Shared Boto Session and Client Configuration
+# ============================================================================
+# One session per process: credentials and region are resolved only once
+BOTO_SESSION = boto3.Session()
+
+# Connection pool sized for concurrent tool calls and agents, with adaptive
+# retries that back off client-side when Bedrock starts throttling
+BOTO_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+)
+
+
+def shared_client_args() -> dict:
+    """
+    Build BedrockModel keyword arguments that reuse the shared boto session.
+
+    Returns:
+        dict: `boto_session` and `boto_client_config` for BedrockModel
+    """
+    return {"boto_session": BOTO_SESSION, "boto_client_config": BOTO_CLIENT_CONFIG}
@@ -0,0 +1,120 @@
+"""
+Compare Models Side by Side
+===========================
+Tutorials 2.1, 2.2 and 2.3 each try a single model provider. This script
+asks the same question to Anthropic, OpenAI and Ollama at the same time and
+prints the answers together, so comparing providers takes as long as the
+slowest model instead of the sum of all three.
+
+Providers without credentials (or a running Ollama server) are reported
+as errors without stopping the others.
+"""
+
+# ============================================================================
+# STEP 1: Import Required Libraries
+# ============================================================================
+import asyncio
+import time
+
+from strands import Agent
+from strands.models.anthropic import AnthropicModel
+from strands.models.ollama import OllamaModel
+from strands.models.openai import OpenAIModel
+
+from config import get_config
+
+
+# ============================================================================
+# STEP 2: Configure the Models
+# ============================================================================
+# Same settings as tutorials 2.1-2.3, loaded from the shared configuration
+config = get_config()
+
+# Providers to compare, in the order their answers are printed
+PROVIDERS = ["Anthropic", "OpenAI", "Ollama"]
+
+PROMPT = "What model are you and who is your creator? Answer in one sentence."
+
+# Maximum number of model calls in flight at once
+MAX_CONCURRENCY = 3
+
+
+def build_model(name: str):
+    """
+    Create the model for one provider.
+
+    Args:
+        name: Provider name ("Anthropic", "OpenAI" or "Ollama")
+
+    Returns:
+        The provider's Strands model
+    """
+    if name == "Anthropic":
+        return AnthropicModel(
+            client_args={"api_key": config.ANTHROPIC_API_KEY},
+            max_tokens=config.ANTHROPIC_MAX_TOKENS,
+            model_id=config.ANTHROPIC_MODEL_ID,
+        )
+    if name == "OpenAI":
+        return OpenAIModel(
+            client_args={"api_key": config.OPENAI_API_KEY},
+            model_id=config.OPENAI_MODEL,
+        )
+    return OllamaModel(
+        host=config.OLLAMA_HOST,
+        model_id=config.OLLAMA_MODEL_ID,
+        keep_alive=config.OLLAMA_KEEP_ALIVE,
+    )
+
+
+# ============================================================================
+# STEP 3: Ask Every Model Concurrently
+# ============================================================================
+async def ask(name: str, semaphore: asyncio.Semaphore) -> tuple:
+    """
+    Ask one provider the prompt without blocking the event loop.
+
+    The model is built here, inside the try, so a provider that cannot even
+    be set up (e.g. a missing API key) is reported like any other error.
+
+    Args:
+        name: Provider name
+        semaphore: Limits how many model calls are in flight at once
+
+    Returns:
+        tuple: (provider name, answer or error message, elapsed seconds)
+    """
+    async with semaphore:
+        start = time.perf_counter()
+        try:
+            # callback_handler=None: the agents run concurrently, so streaming
+            # them to the console would interleave their tokens
+            agent = Agent(model=build_model(name), callback_handler=None)
+
+            # Agent calls are blocking, so run each one in a worker thread
+            result = await asyncio.to_thread(agent, PROMPT)
+            answer = str(result).strip()
+        except Exception as e:
+            answer = f"❌ Error: {e}"
+        return name, answer, time.perf_counter() - start
+
+
+async def compare_models():
+    """Ask all providers concurrently and print their answers."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(ask(name, semaphore) for name in PROVIDERS))
+    total = time.perf_counter() - start
+
+    for name, answer, elapsed in results:
+        print(f"\n🤖 {name} ({elapsed:.1f}s)")
+        print(f"   {answer}")
+    print(f"\n⏱️  Total wall-clock time: {total:.1f}s")
+
+
+# ============================================================================
+# STEP 4: Run the Comparison
+# ============================================================================
+if __name__ == "__main__":
+    asyncio.run(compare_models())
@@ -0,0 +1,51 @@
+"""
+Shared Tutorial Configuration
+=============================
+Loads the .env file and reads every environment setting used by the
+tutorials in one place.
+
+`get_config()` is cached, so the .env file is parsed only once per process
+no matter how many tutorial modules import it.
+"""
+
+import os
+from functools import lru_cache
+from types import SimpleNamespace
+
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=1)
+def get_config() -> SimpleNamespace:
+    """
+    Load environment variables (including .env) and return the tutorial settings.
+
+    Returns:
+        SimpleNamespace: Settings with sensible defaults; API keys and AWS
+            credentials are None when not set
+    """
+    # Load API keys and configuration from .env file
+    # This keeps sensitive credentials out of your code
+    load_dotenv()
+
+    return SimpleNamespace(
+        # Anthropic (tutorial 2.1)
+        ANTHROPIC_API_KEY=os.getenv("ANTHROPIC_API_KEY"),
+        ANTHROPIC_MODEL_ID=os.getenv("ANTHROPIC_CLAUDE_4", "claude-sonnet-4-20250514"),
+        ANTHROPIC_MAX_TOKENS=int(os.getenv("ANTHROPIC_MAX_TOKENS", "1536")),
+        ANTHROPIC_THINKING_BUDGET=int(os.getenv("ANTHROPIC_THINKING_BUDGET", "1024")),
+
+        # OpenAI (tutorial 2.2)
+        OPENAI_API_KEY=os.getenv("OPENAI_API_KEY"),
+        OPENAI_MODEL=os.getenv("OPENAI_MODEL", "gpt-5"),
+
+        # Ollama (tutorial 2.3)
+        OLLAMA_HOST=os.getenv("OLLAMA_HOST", "http://localhost:11434"),
+        OLLAMA_MODEL_ID=os.getenv("OLLAMA_MODEL_ID", "llama3.2:3b"),
+        OLLAMA_KEEP_ALIVE=os.getenv("OLLAMA_KEEP_ALIVE", "10m"),
+
+        # AWS (tutorial 4.1)
+        AWS_ACCESS_KEY_ID=os.getenv("AWS_ACCESS_KEY_ID"),
+        AWS_SECRET_ACCESS_KEY=os.getenv("AWS_SECRET_ACCESS_KEY"),
+        AWS_REGION=os.getenv("AWS_REGION", "us-west-2"),
+    )
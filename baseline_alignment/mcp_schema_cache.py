@@ -0,0 +1,81 @@
+"""
+MCP Tool Schema Cache
+=====================
+Listing tools asks the MCP server for its tool schemas over stdio. That
+answer only changes when the server package changes, so
+`list_tools_cached` stores it on disk and rebuilds the agent tools from the
+cached schemas on warm runs.
+
+The MCP client must still be started before the agent runs, because the
+cached tools call the server when they are invoked.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from mcp.types import Tool
+from strands.tools.mcp import MCPAgentTool
+
+
+# ============================================================================
+# Cache Settings
+# ============================================================================
+# Directory holding one JSON file per MCP server (outside the repository)
+CACHE_DIR = os.path.join(tempfile.gettempdir(), "mcp_schema_cache")
+
+# Cached schemas older than this are refreshed from the server (in seconds)
+# Unpinned server packages may be upgraded by uvx, so don't keep them forever
+CACHE_TTL = 24 * 60 * 60
+
+
+def list_tools_cached(client, server_spec: str) -> list:
+    """
+    Return the MCP server's tools, using cached tool schemas when available.
+
+    Args:
+        client: Started MCPClient for the server
+        server_spec (str): Identifies the server version, e.g. the uvx package
+            spec; a different spec never reuses another spec's cache
+
+    Returns:
+        list: MCPAgentTool objects bound to the client
+    """
+    cache_key = hashlib.blake2b(server_spec.encode()).hexdigest()
+    cache_file = os.path.join(CACHE_DIR, f"{cache_key}.json")
+
+    # Warm start: rebuild the tools from the cached schemas
+    # A damaged or outdated cache file (e.g. an interrupted write, or schemas
+    # from another mcp version) is deleted and the server is asked again
+    if os.path.exists(cache_file) and time.time() - os.path.getmtime(cache_file) < CACHE_TTL:
+        try:
+            with open(cache_file) as f:
+                schemas = json.load(f)
+            return [MCPAgentTool(Tool.model_validate(schema), client) for schema in schemas]
+        except (OSError, ValueError, TypeError) as e:
+            # ValueError also covers JSON decoding and pydantic validation errors
+            print(f"⚠️  Ignoring unreadable MCP schema cache {cache_file}: {e}")
+            try:
+                os.remove(cache_file)
+            except OSError:
+                pass
+
+    # Cold start: ask the server and cache its answer
+    tools = client.list_tools_sync()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    # Write to a temporary file and rename it into place, so a concurrent or
+    # interrupted run never sees a half-written cache file
+    # Failing to cache is not an error: the next run just asks the server again
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump([tool.mcp_tool.model_dump(mode="json") for tool in tools], f)
+        os.replace(tmp_path, cache_file)
+    except (OSError, ValueError, TypeError) as e:
+        print(f"⚠️  Could not write MCP schema cache {cache_file}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return tools
@@ -0,0 +1,101 @@
+"""
+Response Cache for Repeated Prompts
+===================================
+The introductory tutorials ask the same question on every run. Wrapping an
+agent with `cached_agent_call` answers a repeated prompt from a local cache
+instead of making another LLM round-trip.
+
+Cache entries are keyed by (model ID, sampling settings, system prompt,
+normalized prompt) and persist across runs in a small shelve file in the
+system temp directory. The file keeps at most MAX_CACHE_ENTRIES answers,
+dropping the oldest first, and answers expire after CACHE_TTL_SECONDS.
+Agents sampling at a high temperature are returned unwrapped, since their
+answers are meant to vary from call to call.
+"""
+
+import hashlib
+import os
+import shelve
+import tempfile
+import time
+
+
+# ============================================================================
+# Cache Settings
+# ============================================================================
+# Location of the persistent cache (outside the repository)
+CACHE_PATH = os.path.join(tempfile.gettempdir(), "strands_response_cache")
+
+# Agents sampling above this temperature are never cached
+MAX_CACHEABLE_TEMPERATURE = 0.5
+
+# Maximum number of cached answers, and how long each one stays valid
+MAX_CACHE_ENTRIES = 1024
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def _sampling_param(config: dict, name: str):
+    """Read a sampling setting from a model config (top level or `params`)."""
+    return config.get(name, (config.get("params") or {}).get(name))
+
+
+def _cache_key(model_id: str, sampling: tuple, system_prompt: str, prompt: str) -> str:
+    """Hash the inputs that determine an agent's answer into a cache key."""
+    normalized_prompt = " ".join(prompt.split()).lower()
+    raw_key = f"{model_id}|{sampling}|{system_prompt}|{normalized_prompt}"
+    return hashlib.blake2b(raw_key.encode()).hexdigest()
+
+
+def _store(cache, key: str, answer: str) -> None:
+    """Store an answer, dropping the oldest entries beyond MAX_CACHE_ENTRIES."""
+    cache[key] = (time.time(), answer)
+    if len(cache) > MAX_CACHE_ENTRIES:
+        # Entries without a timestamp (older cache format) are dropped first
+        stored_at = {k: v[0] if isinstance(v, tuple) else 0 for k, v in cache.items()}
+        for old_key in sorted(stored_at, key=stored_at.get)[:len(cache) - MAX_CACHE_ENTRIES]:
+            del cache[old_key]
+
+
+def cached_agent_call(agent, path: str = CACHE_PATH):
+    """
+    Wrap an agent so that repeated prompts are answered from the cache.
+
+    On a miss the agent streams its answer as usual; on a hit the cached
+    answer is printed instead, so the output looks the same either way.
+
+    Args:
+        agent: Strands Agent to wrap
+        path (str): Shelve file used to persist cached responses
+
+    Returns:
+        callable: Function taking a prompt string and returning the answer
+            text (str) on both a cache hit and a miss, or the agent itself
+            when its temperature is above MAX_CACHEABLE_TEMPERATURE
+    """
+    config = agent.model.get_config()
+    temperature = _sampling_param(config, "temperature")
+    if temperature is not None and temperature > MAX_CACHEABLE_TEMPERATURE:
+        return agent
+
+    model_id = config.get("model_id", "")
+    sampling = (temperature, _sampling_param(config, "top_p"))
+    system_prompt = agent.system_prompt or ""
+
+    def call(prompt: str):
+        key = _cache_key(model_id, sampling, system_prompt, prompt)
+
+        with shelve.open(path) as cache:
+            entry = cache.get(key)
+            if isinstance(entry, tuple) and time.time() - entry[0] < CACHE_TTL_SECONDS:
+                print("X-Cache: HIT")
+                print(entry[1])
+                return entry[1]
+
+        print("X-Cache: MISS")
+        answer = str(agent(prompt))
+
+        with shelve.open(path) as cache:
+            _store(cache, key, answer)
+        return answer
+
+    return call
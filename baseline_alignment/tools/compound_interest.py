@@ -1,6 +1,19 @@
 from strands import tool
 
 
+# Compounding frequency (times per year) -> description, built once at import
+_FREQ_DESC = {
+    1: "annually",
+    2: "semi-annually",
+    4: "quarterly",
+    12: "monthly",
+    52: "weekly",
+    365: "daily"
+}
+
+# Separator line under the result heading
+_SEP = "=" * 40
+
 @tool
 def calculate_compound_interest(
     principal: float,
@@ -36,18 +49,11 @@ def calculate_compound_interest(
     interest_earned = amount - principal
     
     # Determine compounding frequency description
-    frequency_desc = {
-        1: "annually",
-        2: "semi-annually",
-        4: "quarterly",
-        12: "monthly",
-        52: "weekly",
-        365: "daily"
-    }.get(frequency, f"{frequency} times per year")
+    frequency_desc = _FREQ_DESC.get(frequency) or f"{frequency} times per year"
     
     # Format the result
     result = f"""Compound Interest Calculation
-{'=' * 40}
+{_SEP}
 Principal Amount:    ${principal:,.2f}
 Annual Interest Rate: {rate}%
 Time Period:         {time} year(s)
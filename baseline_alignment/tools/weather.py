@@ -1,10 +1,19 @@
 from strands import tool
-import requests
+import httpx
 from typing import Optional
 
 
+# Async HTTP client settings: the agent's event loop keeps streaming and
+# running other tools while a lookup waits on the network.
+# Each lookup opens its own client and closes it when done: an AsyncClient
+# is bound to the event loop it runs on, and each synchronous agent call
+# runs a new loop, so a client kept between calls would leak its loop and
+# connections.
+_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+
+
 @tool
-def fetch_weather(location: str, units: str = "metric") -> str:
+async def fetch_weather(location: str, units: str = "metric") -> str:
     """
     Fetch current weather data for a specified location.
     
@@ -35,7 +44,8 @@ def fetch_weather(location: str, units: str = "metric") -> str:
             "units": units
         }
         
-        response = requests.get(base_url, params=params)
+        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
+            response = await client.get(base_url, params=params)
         response.raise_for_status()
         
         data = response.json()
@@ -69,14 +79,16 @@ Wind Speed: {wind_speed} {speed_unit}
 """
         return weather_info.strip()
         
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             return f"Error: Location '{location}' not found. Please check the spelling or try a different format."
         elif e.response.status_code == 401:
             return "Error: Invalid API key. Please set up a valid OpenWeatherMap API key."
         else:
-            return f"Error: HTTP {e.response.status_code} - {e.response.reason}"
-    except requests.exceptions.RequestException as e:
+            return f"Error: HTTP {e.response.status_code} - {e.response.reason_phrase}"
+    except httpx.TimeoutException:
+        return "Error: The weather service did not respond in time. Please try again."
+    except httpx.RequestError as e:
         return f"Error: Network error occurred - {str(e)}"
     except KeyError as e:
         return f"Error: Unexpected response format - missing field {str(e)}"
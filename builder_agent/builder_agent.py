@@ -2,37 +2,33 @@
 Builder Agent - An AI agent that can create and deploy other agents.
 """
 
+import contextvars
 import logging
 import os
+import sys
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# Shared modules (utils/, services/, prompts/) are copied next to this file
+# in the container, where they are importable already; when running from the
+# repository they live one level up, so that directory is added once here
+# instead of every tool module adjusting sys.path itself
+_AGENT_DIR = Path(__file__).resolve().parent
+if not (_AGENT_DIR / "utils").is_dir():
+    sys.path.append(str(_AGENT_DIR.parent))
+
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv()
 
-# Strands framework
-from strands import Agent, tool
-from strands.models import BedrockModel
-
-# Strands tools
-from strands_tools.browser import AgentCoreBrowser
-
-# Builder Agent tools
-from tools import list_available_tools, deploy_agent, create_gateway, create_lambda_tools, list_deployed_agents
-
-# Prompts
-from prompts.builder_agent_prompts import BUILDER_AGENT_SYSTEM_PROMPT
-
-# Services
-from services.memory_hooks import AgentCoreMemoryHook
-from bedrock_agentcore.memory import MemoryClient
-
-# AWS SDK
-import boto3
-
 # Utilities
 from utils.logging_config import get_logger
 
+# Only the runtime app is imported at startup, so the container answers
+# health checks sooner after a cold start. The Strands SDK, the Builder Agent
+# tools, prompts and services are imported on the first invocation (see
+# _get_model/_new_browser/_get_memory_client and _invoke_agent).
 from bedrock_agentcore.runtime import BedrockAgentCoreApp
 
 # Setup logging
@@ -40,19 +36,77 @@ logger = get_logger(__name__)
 
 app = BedrockAgentCoreApp()
 
+
+# Model and memory clients are created once per container and reused by
+# every invocation; building their boto3 clients on each request would add
+# the full client bootstrap cost to every response
+@lru_cache(maxsize=8)
+def _get_model(model_id: str, region: str) -> "BedrockModel":
+    """Get the shared Bedrock model for a model ID and region."""
+    from strands.models import BedrockModel
+    from utils.aws_helpers import get_boto3_session
+    return BedrockModel(model_id=model_id, boto_session=get_boto3_session(region))
+
+
+def _new_browser(region: str) -> "AgentCoreBrowser":
+    """
+    Create the AgentCore browser tool for one invocation.
+    
+    Not shared: the browser runs its actions on its own event loop and keeps
+    sessions under names the model picks, so concurrent invocations sharing
+    one would drive that loop from several threads and could collide on
+    session names. Browser sessions are only started when the tool is used.
+    """
+    from strands_tools.browser import AgentCoreBrowser
+    return AgentCoreBrowser(region=region)
+
+
+@lru_cache(maxsize=8)
+def _get_memory_client(region: str) -> "MemoryClient":
+    """Get the shared AgentCore Memory client for a region."""
+    from bedrock_agentcore.memory import MemoryClient
+    return MemoryClient(region_name=region)
+
+
+@lru_cache(maxsize=256)
+def _get_memory_hook(memory_id: str, session_id: str, actor_id: str, region: str) -> "AgentCoreMemoryHook":
+    """
+    Get the memory hook for a conversation.
+    
+    The hook only holds the memory client and the conversation IDs, so later
+    turns of the same session reuse it; the least recently used hooks are
+    dropped once 256 conversations are cached.
+    """
+    from services.memory_hooks import AgentCoreMemoryHook
+    return AgentCoreMemoryHook(
+        memory_client=_get_memory_client(region),
+        memory_id=memory_id,
+        session_id=session_id,
+        actor_id=actor_id,
+        history_turns=5
+    )
+
+
 @app.entrypoint
 def invoke_agent(payload, context):
+    # Run each invocation in its own copy of the context, so the once-per-session
+    # guards it starts are never seen by other (concurrent) invocations
+    return contextvars.copy_context().run(_invoke_agent, payload, context)
+
+
+def _invoke_agent(payload, context):
     try:
-        # Reset deployment trackers at the start of each invocation
+        # Strands framework, Builder Agent tools, prompts and services
+        # (loaded on the first invocation, already cached in sys.modules after)
+        from strands import Agent
+        from tools import list_available_tools, deploy_agent, create_gateway, create_lambda_tools, list_deployed_agents
+        from prompts.builder_agent_prompts import BUILDER_SYSTEM_BLOCKS
+        
+        # Start fresh once-per-session guards for this invocation
         # This prevents duplicate creations within a single request
-        from tools.deploy_agent import _deployment_tracker
-        from tools.create_gateway import _gateway_tracker
-        _deployment_tracker['deployed'] = False
-        _deployment_tracker['agent_name'] = None
-        _gateway_tracker['created'] = False
-        _gateway_tracker['gateway_id'] = None
-        _gateway_tracker['gateway_name'] = None
-        logger.info("🔄 Reset deployment trackers for new invocation")
+        from utils.dedup import reset_session_actions
+        reset_session_actions()
+        logger.info("🔄 Reset once-per-session guards for new invocation")
         
         # Extract parameters from payload
         user_input = payload.get("prompt", "")
@@ -68,19 +122,18 @@ def invoke_agent(payload, context):
         region = os.getenv('AWS_REGION', 'us-west-2')
         model_id = os.getenv('MODEL_ID', 'us.anthropic.claude-sonnet-4-5-20250929-v1:0')
         
-        # Initialize tools
-        browser = AgentCoreBrowser(region=region)
+        # Browser tool for this invocation only
+        browser = _new_browser(region)
         
-        # Initialize model
-        model = BedrockModel(model_id=model_id, region_name=region)
+        # Get shared model
+        model = _get_model(model_id, region)
         
-        # Create memory hook
-        memory_hook = AgentCoreMemoryHook(
-            memory_client=MemoryClient(region_name=region),
-            memory_id=os.getenv('BEDROCK_AGENTCORE_MEMORY_ID'),
-            session_id=session_id,
-            actor_id=actor_id,
-            history_turns=5
+        # Get the memory hook for this conversation (session and actor)
+        memory_hook = _get_memory_hook(
+            os.getenv('BEDROCK_AGENTCORE_MEMORY_ID'),
+            session_id,
+            actor_id,
+            region
         )
         
         # Create agent
@@ -94,7 +147,7 @@ def invoke_agent(payload, context):
                 create_lambda_tools,
                 list_deployed_agents
             ],
-            system_prompt=BUILDER_AGENT_SYSTEM_PROMPT,
+            system_prompt=BUILDER_SYSTEM_BLOCKS,  # Cached system prompt
             hooks=[memory_hook],  # Enable AgentCore Memory
             callback_handler=None  # Disable to prevent duplicate output
         )
@@ -102,6 +155,14 @@ def invoke_agent(payload, context):
         # Process the message
         response_message = agent(user_input)
         
+        # Log prompt cache usage (reads mean the system prompt came from the cache)
+        usage = response_message.metrics.accumulated_usage
+        logger.info(
+            f"📊 Tokens - input: {usage.get('inputTokens', 0)}, "
+            f"cache read: {usage.get('cacheReadInputTokens', 0)}, "
+            f"cache write: {usage.get('cacheWriteInputTokens', 0)}"
+        )
+        
         # Return response as dict with 'result' key (AgentCore requirement)
         return {"result": str(response_message)}
         
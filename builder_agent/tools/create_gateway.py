@@ -4,24 +4,50 @@ Create Gateway Tool for Builder Agent
 
 import os
 import logging
-import boto3
-import sys
-from pathlib import Path
 from strands import tool
 
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from utils.response_formatter import format_deployment_success, format_deployment_error
 from utils.validation import sanitize_gateway_name
+from utils.aws_helpers import get_boto3_client
+from utils.dedup import once_per_session, mark_session_action
 
 logger = logging.getLogger(__name__)
 
-# Global state to prevent duplicate gateway creation in the same session
-_gateway_tracker = {
-    'created': False,
-    'gateway_id': None,
-    'gateway_name': None
-}
+# Response when a gateway was already created in this session
+_DUPLICATE_GATEWAY_TEMPLATE = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    ⚠️  DUPLICATE GATEWAY CREATION BLOCKED                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+A gateway has already been created in this session: {gateway_name}
+Gateway ID: {gateway_id}
+
+Use this gateway_id for creating Lambda tools and deploying the agent.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+""".strip()
+
+
+# Response after a gateway is created
+_GATEWAY_CREATED_TEMPLATE = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        ✅ GATEWAY CREATED SUCCESSFULLY                       ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+🌐 Gateway: {name}
+🆔 Gateway ID: {gateway_id}
+📋 Description: {description}
+🔗 MCP URL: {mcp_url}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Next Steps:
+  1. Create Lambda tools and register them with this gateway
+  2. Deploy agents with gateway_id='{gateway_id}'
+  3. Agents will have access to all tools in this gateway
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+""".strip()
 
 
 @tool
@@ -37,20 +63,9 @@ def create_gateway(name: str, description: str) -> str:
         Formatted success message with gateway ID
     """
     # Check if we've already created a gateway in this session
-    if _gateway_tracker['created']:
-        logger.warning(f"⚠️  Attempted duplicate gateway creation blocked. Already created: {_gateway_tracker['gateway_name']}")
-        return f"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                    ⚠️  DUPLICATE GATEWAY CREATION BLOCKED                    ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-
-A gateway has already been created in this session: {_gateway_tracker['gateway_name']}
-Gateway ID: {_gateway_tracker['gateway_id']}
-
-Use this gateway_id for creating Lambda tools and deploying the agent.
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-""".strip()
+    duplicate = once_per_session('gateway', _DUPLICATE_GATEWAY_TEMPLATE)
+    if duplicate:
+        return duplicate
     
     try:        
         region = os.getenv('AWS_REGION', 'us-west-2')
@@ -64,7 +79,7 @@ Use this gateway_id for creating Lambda tools and deploying the agent.
             )
         
         # Create gateway using AgentCore API
-        agentcore = boto3.client('bedrock-agentcore-control', region_name=region)
+        agentcore = get_boto3_client('bedrock-agentcore-control', region)
         
         # Sanitize name using centralized validation
         safe_name = sanitize_gateway_name(name)
@@ -86,30 +101,14 @@ Use this gateway_id for creating Lambda tools and deploying the agent.
         mcp_url = response.get('gatewayUrl', 'N/A')
         
         # Mark as created to prevent duplicates
-        _gateway_tracker['created'] = True
-        _gateway_tracker['gateway_id'] = gateway_id
-        _gateway_tracker['gateway_name'] = name
-        logger.info(f"✅ Gateway tracker updated: {name} ({gateway_id})")
+        mark_session_action('gateway', gateway_name=name, gateway_id=gateway_id)
                 
-        return f"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                        ✅ GATEWAY CREATED SUCCESSFULLY                       ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-
-🌐 Gateway: {name}
-🆔 Gateway ID: {gateway_id}
-📋 Description: {description}
-🔗 MCP URL: {mcp_url}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-Next Steps:
-  1. Create Lambda tools and register them with this gateway
-  2. Deploy agents with gateway_id='{gateway_id}'
-  3. Agents will have access to all tools in this gateway
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-""".strip()
+        return _GATEWAY_CREATED_TEMPLATE.format(
+            name=name,
+            gateway_id=gateway_id,
+            description=description,
+            mcp_url=mcp_url
+        )
         
     except Exception as e:
         logger.error(f"Gateway creation failed: {e}", exc_info=True)
@@ -4,29 +4,176 @@ Create Lambda Tools for Builder Agent
 
 import os
 import logging
-import boto3
 import json
-import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
 from strands import tool
 
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# orjson parses large tool specs (kilobytes of handler code) much faster;
+# fall back to the standard library when it isn't installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from services.lambda_service import LambdaService, LambdaToolSpec
+from utils.aws_helpers import get_account_id, get_boto3_client
 from utils.response_formatter import format_deployment_error
 from utils.validation import sanitize_gateway_target_name
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of tools created at the same time
+TOOL_CONCURRENCY_LIMIT = int(os.getenv('TOOL_CONCURRENCY_LIMIT', '8'))
+
+# (function name, gateway ID) pairs whose invoke permission is known to exist,
+# so updating a tool for the same gateway skips the add_permission call
+# A newly created function has no permissions yet, so its pair is always re-added
+_gateway_permissions_added: set[tuple[str, str]] = set()
+
+# Response after all Lambda tools are created
+_TOOLS_CREATED_TEMPLATE = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                      ✅ LAMBDA TOOLS CREATED SUCCESSFULLY                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+🌐 Gateway ID: {gateway_id}
+🛠️  Tools Created: {tool_count}
+
+{tools_list}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Next Step:
+  Deploy an agent with gateway_id='{gateway_id}' to use these tools
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+""".strip()
+
+
+def _create_one_tool(
+    tool_def: dict,
+    gateway_id: str,
+    gateway_arn: str,
+    execution_role: str,
+    lambda_service: LambdaService,
+    agentcore,
+    lambda_client
+) -> dict:
+    """
+    Create one Lambda tool and register it with the gateway.
+    
+    Runs on a worker thread; the services and boto3 clients are shared
+    between threads.
+    
+    Args:
+        tool_def: Tool specification (name, description, input_schema, handler_code)
+        gateway_id: Gateway ID to register the tool with
+        gateway_arn: Gateway ARN allowed to invoke the Lambda function
+        execution_role: IAM role ARN for Lambda execution
+        lambda_service: Service used to create the Lambda function
+        agentcore: bedrock-agentcore-control client
+        lambda_client: Lambda client
+    
+    Returns:
+        Dict with name, function_arn and description of the created tool
+    
+    Raises:
+        Exception: If the tool definition is invalid or an AWS call fails
+    """
+    tool_name = tool_def.get('name', 'unknown')
+    logger.info(f"Creating tool: {tool_name}")
+    
+    # Validate tool definition
+    if not all(k in tool_def for k in ['name', 'description', 'input_schema', 'handler_code']):
+        raise ValueError("Tool missing required fields")
+    
+    # Create Lambda function
+    tool_spec = LambdaToolSpec(
+        name=tool_def['name'],
+        description=tool_def['description'],
+        input_schema=tool_def['input_schema'],
+        handler_code=tool_def['handler_code']
+    )
+    
+    lambda_result = lambda_service.create_tool_function(
+        tool_spec=tool_spec,
+        execution_role_arn=execution_role,
+        function_prefix=f"gateway-{gateway_id}"
+    )
+    
+    # Register with gateway as a target
+    # Sanitize target name using centralized validation
+    target_name = sanitize_gateway_target_name(tool_def['name'])
+    
+    agentcore.create_gateway_target(
+        gatewayIdentifier=gateway_id,
+        name=target_name,
+        description=tool_def['description'],
+        targetConfiguration={
+            'mcp': {
+                'lambda': {
+                    'lambdaArn': lambda_result['function_arn'],
+                    'toolSchema': {
+                        'inlinePayload': [
+                            {
+                                'name': tool_def['name'],
+                                'description': tool_def['description'],
+                                'inputSchema': tool_def['input_schema']
+                            }
+                        ]
+                    }
+                }
+            }
+        },
+        credentialProviderConfigurations=[
+            {
+                'credentialProviderType': 'GATEWAY_IAM_ROLE'
+            }
+        ]
+    )
+    
+    # Add Lambda invoke permission for the gateway (once per function and gateway)
+    permission_key = (lambda_result['function_name'], gateway_id)
+    if lambda_result['created']:
+        # A function deleted and created again lost the permission it had
+        _gateway_permissions_added.discard(permission_key)
+    
+    if permission_key in _gateway_permissions_added:
+        logger.info(f'Lambda invoke permission already added')
+    else:
+        try:
+            lambda_client.add_permission(
+                FunctionName=lambda_result['function_name'],
+                StatementId=f'AllowGatewayInvoke-{gateway_id}',
+                Action='lambda:InvokeFunction',
+                Principal='bedrock-agentcore.amazonaws.com',
+                SourceArn=gateway_arn
+            )
+            _gateway_permissions_added.add(permission_key)
+            logger.info(f'Added Lambda invoke permission for gateway')
+        except lambda_client.exceptions.ResourceConflictException:
+            _gateway_permissions_added.add(permission_key)
+            logger.info(f'Lambda invoke permission already exists')
+        except Exception as e:
+            logger.warning(f'Failed to add Lambda permission (may already exist): {e}')
+    
+    return {
+        'name': tool_name,
+        'function_arn': lambda_result['function_arn'],
+        'description': tool_def['description']
+    }
+
 
 @tool
-def create_lambda_tools(gateway_id: str, tools_spec: str) -> str:
+def create_lambda_tools(gateway_id: str, tools_spec: Union[str, list]) -> str:
     """
     Create Lambda functions as tools and register with gateway.
     
     Args:
         gateway_id: Gateway ID to register tools with
-        tools_spec: JSON string with array of tool specifications
+        tools_spec: Array of tool specifications, or a JSON string containing it
     
     Tool spec format:
     [
@@ -63,9 +210,11 @@ def create_lambda_tools(gateway_id: str, tools_spec: str) -> str:
                 ]
             )
         
-        # Parse tools spec
+        # Parse tools spec (already parsed when given as an array; anything
+        # else that is not a string, e.g. a single spec object, is left as is
+        # and rejected below)
         try:
-            tools = json.loads(tools_spec)
+            tools = _json_loads(tools_spec) if isinstance(tools_spec, str) else tools_spec
         except json.JSONDecodeError as e:
             return format_deployment_error(
                 error_type="Invalid JSON",
@@ -82,120 +231,56 @@ def create_lambda_tools(gateway_id: str, tools_spec: str) -> str:
         
         # Initialize services
         lambda_service = LambdaService(region_name=region)
-        agentcore = boto3.client('bedrock-agentcore-control', region_name=region)
+        agentcore = get_boto3_client('bedrock-agentcore-control', region)
+        lambda_client = get_boto3_client('lambda', region)
+        
+        # The gateway ARN is the same for every tool, so build it once
+        account_id = get_account_id()
+        gateway_arn = f'arn:aws:bedrock-agentcore:{region}:{account_id}:gateway/{gateway_id}'
         
         # Create Lambda functions
         created_tools = []
         failed_tools = []
         
-        for tool_def in tools:
-            tool_name = tool_def.get('name', 'unknown')
-            logger.info(f"Creating tool: {tool_name}")
-            
-            try:
-                # Validate tool definition
-                if not all(k in tool_def for k in ['name', 'description', 'input_schema', 'handler_code']):
-                    raise ValueError("Tool missing required fields")
-                
-                # Create Lambda function
-                tool_spec = LambdaToolSpec(
-                    name=tool_def['name'],
-                    description=tool_def['description'],
-                    input_schema=tool_def['input_schema'],
-                    handler_code=tool_def['handler_code']
-                )
-                
-                lambda_result = lambda_service.create_tool_function(
-                    tool_spec=tool_spec,
-                    execution_role_arn=execution_role,
-                    function_prefix=f"gateway-{gateway_id}"
-                )
-                
-                # Register with gateway as a target
-                # Sanitize target name using centralized validation
-                target_name = sanitize_gateway_target_name(tool_def['name'])
-                
-                agentcore.create_gateway_target(
-                    gatewayIdentifier=gateway_id,
-                    name=target_name,
-                    description=tool_def['description'],
-                    targetConfiguration={
-                        'mcp': {
-                            'lambda': {
-                                'lambdaArn': lambda_result['function_arn'],
-                                'toolSchema': {
-                                    'inlinePayload': [
-                                        {
-                                            'name': tool_def['name'],
-                                            'description': tool_def['description'],
-                                            'inputSchema': tool_def['input_schema']
-                                        }
-                                    ]
-                                }
-                            }
-                        }
-                    },
-                    credentialProviderConfigurations=[
-                        {
-                            'credentialProviderType': 'GATEWAY_IAM_ROLE'
-                        }
-                    ]
+        # Create the tools in parallel: each tool is a chain of independent
+        # AWS calls, so N tools take about as long as the slowest one
+        max_workers = max(1, min(len(tools), TOOL_CONCURRENCY_LIMIT))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _create_one_tool,
+                    tool_def,
+                    gateway_id=gateway_id,
+                    gateway_arn=gateway_arn,
+                    execution_role=execution_role,
+                    lambda_service=lambda_service,
+                    agentcore=agentcore,
+                    lambda_client=lambda_client
                 )
-                
-                # Add Lambda invoke permission for the gateway
-                lambda_client = boto3.client('lambda', region_name=region)
-                sts = boto3.client('sts')
-                account_id = sts.get_caller_identity()['Account']
-                
+                for tool_def in tools
+            ]
+            
+            # Collect results in the order the tools were given
+            for tool_def, future in zip(tools, futures):
+                tool_name = tool_def.get('name', 'unknown')
                 try:
-                    lambda_client.add_permission(
-                        FunctionName=lambda_result['function_name'],
-                        StatementId=f'AllowGatewayInvoke-{gateway_id}',
-                        Action='lambda:InvokeFunction',
-                        Principal='bedrock-agentcore.amazonaws.com',
-                        SourceArn=f'arn:aws:bedrock-agentcore:{region}:{account_id}:gateway/{gateway_id}'
-                    )
-                    logger.info(f'Added Lambda invoke permission for gateway')
-                except lambda_client.exceptions.ResourceConflictException:
-                    logger.info(f'Lambda invoke permission already exists')
+                    created_tools.append(future.result())
+                    logger.info(f"✓ Tool created: {tool_name}")
                 except Exception as e:
-                    logger.warning(f'Failed to add Lambda permission (may already exist): {e}')
-                
-                created_tools.append({
-                    'name': tool_name,
-                    'function_arn': lambda_result['function_arn'],
-                    'description': tool_def['description']
-                })
-                
-                logger.info(f"✓ Tool created: {tool_name}")
-                
-            except Exception as e:
-                logger.error(f"Failed to create tool {tool_name}: {e}")
-                failed_tools.append({'name': tool_name, 'error': str(e)})
+                    logger.error(f"Failed to create tool {tool_name}: {e}")
+                    failed_tools.append({'name': tool_name, 'error': str(e)})
         
         # Format response
         if created_tools and not failed_tools:
-            tools_list = '\n'.join([f"  • {t['name']}: {t['description']}" for t in created_tools])
-            return f"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                      ✅ LAMBDA TOOLS CREATED SUCCESSFULLY                    ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-
-🌐 Gateway ID: {gateway_id}
-🛠️  Tools Created: {len(created_tools)}
-
-{tools_list}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-Next Step:
-  Deploy an agent with gateway_id='{gateway_id}' to use these tools
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-""".strip()
+            tools_list = '\n'.join(f"  • {t['name']}: {t['description']}" for t in created_tools)
+            return _TOOLS_CREATED_TEMPLATE.format(
+                gateway_id=gateway_id,
+                tool_count=len(created_tools),
+                tools_list=tools_list
+            )
         
         elif failed_tools:
-            errors = '\n'.join([f"  • {t['name']}: {t['error']}" for t in failed_tools])
+            errors = '\n'.join(f"  • {t['name']}: {t['error']}" for t in failed_tools)
             return format_deployment_error(
                 error_type="Partial Failure",
                 error_message=f"Created {len(created_tools)} tools, {len(failed_tools)} failed\n\nFailed:\n{errors}",
@@ -7,23 +7,58 @@ The agent behavior is configured via environment variables.
 
 import os
 import logging
-import boto3
-import sys
-from pathlib import Path
+from typing import Optional
 from strands import tool
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from utils.response_formatter import format_deployment_success, format_deployment_error, format_agent_update
 from utils.validation import sanitize_runtime_name
+from utils.aws_helpers import get_account_id, get_boto3_client
+from utils.dedup import once_per_session, mark_session_action
 
 logger = logging.getLogger(__name__)
 
-# Global state to prevent duplicate deployments in the same session
-_deployment_tracker = {
-    'deployed': False,
-    'agent_name': None
-}
+# Runtime name -> runtime ID of runtimes created or found by this process,
+# so redeploying an existing agent doesn't have to search for it again
+_runtime_ids: dict[str, str] = {}
+
+
+def _find_runtime_id(agentcore_client, runtime_name: str) -> Optional[str]:
+    """
+    Find the ID of an existing runtime by name.
+    
+    Args:
+        agentcore_client: bedrock-agentcore-control client
+        runtime_name: Sanitized runtime name
+    
+    Returns:
+        Runtime ID, or None if no runtime has this name
+    """
+    if runtime_name in _runtime_ids:
+        return _runtime_ids[runtime_name]
+    
+    # Search page by page, stopping at the first match
+    paginator = agentcore_client.get_paginator('list_agent_runtimes')
+    for page in paginator.paginate():
+        for runtime in page.get('agentRuntimes', []):
+            if runtime['agentRuntimeName'] == runtime_name:
+                _runtime_ids[runtime_name] = runtime['agentRuntimeId']
+                return runtime['agentRuntimeId']
+    
+    return None
+
+
+# Response when an agent was already deployed in this session
+_DUPLICATE_DEPLOYMENT_TEMPLATE = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                      ⚠️  DUPLICATE DEPLOYMENT BLOCKED                        ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+An agent has already been deployed in this session: {agent_name}
+
+To create another agent, please start a new conversation.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+""".strip()
 
 
 @tool
@@ -57,19 +92,9 @@ def deploy_agent(
         str: Deployment result
     """
     # Check if we've already deployed an agent in this session
-    if _deployment_tracker['deployed']:
-        logger.warning(f"⚠️  Attempted duplicate deployment blocked. Already deployed: {_deployment_tracker['agent_name']}")
-        return f"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                      ⚠️  DUPLICATE DEPLOYMENT BLOCKED                        ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-
-An agent has already been deployed in this session: {_deployment_tracker['agent_name']}
-
-To create another agent, please start a new conversation.
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-""".strip()
+    duplicate = once_per_session('deployment', _DUPLICATE_DEPLOYMENT_TEMPLATE)
+    if duplicate:
+        return duplicate
     
     try:
         # Get configuration
@@ -81,9 +106,8 @@ To create another agent, please start a new conversation.
         if not execution_role:
             return "❌ Error: AGENTCORE_EXECUTION_ROLE_ARN not configured"
         
-        # Get AWS account ID
-        sts = boto3.client('sts', region_name=region)
-        account_id = sts.get_caller_identity()['Account']
+        # Get AWS account ID (cached after the first call)
+        account_id = get_account_id()
         
         # Sanitize name for runtime using centralized validation
         runtime_name = sanitize_runtime_name(name)
@@ -98,7 +122,7 @@ To create another agent, please start a new conversation.
         # Create AgentCore Runtime
         logger.info("🚀 Creating AgentCore Runtime...")
         
-        agentcore_client = boto3.client('bedrock-agentcore-control', region_name=region)
+        agentcore_client = get_boto3_client('bedrock-agentcore-control', region)
         
         # Determine agent mode:
         # - SERVER: Has gateway (provides tools)
@@ -167,11 +191,10 @@ To create another agent, please start a new conversation.
             agent_id = response['agentRuntimeId']
             agent_arn = response['agentRuntimeArn']
             status = response.get('status', 'CREATING')
+            _runtime_ids[runtime_name] = agent_id
             
             # Mark as deployed to prevent duplicates
-            _deployment_tracker['deployed'] = True
-            _deployment_tracker['agent_name'] = name
-            logger.info(f"✅ Deployment tracker updated: {name}")
+            mark_session_action('deployment', agent_name=name)
             
             return format_deployment_success(
                 agent_id=agent_id,
@@ -189,17 +212,10 @@ To create another agent, please start a new conversation.
             # Runtime already exists, try to update it
             logger.info(f"Runtime {runtime_name} already exists, updating...")
             
-            # List runtimes to find the existing one
-            list_response = agentcore_client.list_agent_runtimes()
-            existing_runtime = None
-            for runtime in list_response.get('agentRuntimeSummaries', []):
-                if runtime['agentRuntimeName'] == runtime_name:
-                    existing_runtime = runtime
-                    break
+            # Find the existing runtime
+            agent_id = _find_runtime_id(agentcore_client, runtime_name)
             
-            if existing_runtime:
-                agent_id = existing_runtime['agentRuntimeId']
-                
+            if agent_id:
                 # Update the runtime
                 update_params = {
                     'agentRuntimeId': agent_id,
@@ -218,14 +234,17 @@ To create another agent, please start a new conversation.
                 if protocol_config:
                     update_params['protocolConfiguration'] = protocol_config
                 
-                update_response = agentcore_client.update_agent_runtime(**update_params)
+                try:
+                    update_response = agentcore_client.update_agent_runtime(**update_params)
+                except agentcore_client.exceptions.ResourceNotFoundException:
+                    # The remembered runtime was deleted since; search again next time
+                    _runtime_ids.pop(runtime_name, None)
+                    raise
                 
                 agent_arn = update_response['agentRuntimeArn']
                 
                 # Mark as deployed to prevent duplicates
-                _deployment_tracker['deployed'] = True
-                _deployment_tracker['agent_name'] = name
-                logger.info(f"✅ Deployment tracker updated (update): {name}")
+                mark_session_action('deployment', agent_name=name)
                 
                 return format_agent_update(
                     agent_id=agent_id,
@@ -6,10 +6,11 @@ Allows the builder agent to discover existing agents and their A2A URLs.
 
 import os
 import logging
-import boto3
 from urllib.parse import quote
 from strands import tool
 
+from utils.aws_helpers import get_boto3_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,11 +32,11 @@ def list_deployed_agents() -> str:
     """
     try:
         region = os.environ.get('AWS_REGION', 'us-west-2')
-        client = boto3.client('bedrock-agentcore-control', region_name=region)
+        client = get_boto3_client('bedrock-agentcore-control', region)
         
-        # List all agents
-        response = client.list_agent_runtimes()
-        agents = response.get('agentRuntimes', [])
+        # List all agents, following every page of results
+        paginator = client.get_paginator('list_agent_runtimes')
+        agents = [a for page in paginator.paginate() for a in page.get('agentRuntimes', [])]
         
         if not agents:
             return "No agents currently deployed."
@@ -53,9 +54,7 @@ def list_deployed_agents() -> str:
             name = agent.get('agentRuntimeName', 'unknown')
             agent_id = agent['agentRuntimeId']
             
-            output.append(f"{idx}. **{name}**")
-            output.append(f"   - Agent ID: `{agent_id}`")
-            output.append("")
+            output.append(f"{idx}. **{name}**\n   - Agent ID: `{agent_id}`\n")
         
         output.append("💡 **Tip**: Use these agent IDs in the `known_agent_ids` parameter when deploying orchestrator agents.")
         
@@ -7,15 +7,8 @@ This tool provides information about all tools available to the Builder Agent.
 from strands import tool
 
 
-@tool
-def list_available_tools() -> str:
-    """
-    List all tools currently available to the Builder Agent.
-    
-    Returns:
-        str: Formatted list of available tools with descriptions and parameters
-    """
-    tools_list = """
+# The tool list is static, so it is built once at import
+_TOOLS_LIST = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                    BUILDER AGENT - AVAILABLE TOOLS                           ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
@@ -160,5 +153,15 @@ Agent with A2A Communication:
   2. deploy_agent(name="CoordinatorBot", known_agent_urls=["url1", "url2"], ...)
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+""".strip()
+
+
+@tool
+def list_available_tools() -> str:
+    """
+    List all tools currently available to the Builder Agent.
+    
+    Returns:
+        str: Formatted list of available tools with descriptions and parameters
     """
-    return tools_list.strip()
+    return _TOOLS_LIST
@@ -9,13 +9,16 @@ Beautiful terminal interface for demonstrating:
 """
 
 import boto3
+from botocore.config import Config
 import json
 import time
-import uuid
+import secrets
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict
+from urllib.parse import quote
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
@@ -28,6 +31,16 @@ from rich import box
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.theme import Theme
 
+# orjson serializes payloads and parses agent responses faster; fall back to
+# the standard library when it isn't installed
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 # Load environment variables from .env file
 try:
     from dotenv import load_dotenv
@@ -35,14 +48,14 @@ try:
     load_dotenv(dotenv_path=env_path)
 except ImportError:
     # dotenv not installed, try to load manually
+    # One regex scan over the file picks out every KEY=value line, skipping
+    # comments and blank lines
+    import re
+    _ENV_RE = re.compile(r'^[ \t]*([^#=\s][^=\n]*)=(.*)$', re.MULTILINE)
     env_path = Path(__file__).parent / '.env'
     if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ.setdefault(key.strip(), value.strip())
+        for key, value in _ENV_RE.findall(env_path.read_text()):
+            os.environ.setdefault(key.strip(), value.strip())
 
 # Custom theme for white background - removes background from inline code
 custom_theme = Theme({
@@ -54,6 +67,30 @@ console = Console(theme=custom_theme)
 REGION = os.getenv('AWS_REGION', 'us-west-2')
 BUILDER_ARN = os.getenv('BUILDER_AGENT_ARN', '').strip()
 
+# Maximum number of agent detail lookups in flight at once
+MAX_DETAIL_WORKERS = 16
+
+# Seconds to reuse the agent list between menu views
+AGENT_LIST_TTL = 5.0
+
+# Client settings for AgentCore calls: adaptive retries, a read timeout long
+# enough for builder invocations that deploy agents, keepalive so repeated
+# chat messages reuse the connection, and a pool larger than
+# MAX_DETAIL_WORKERS for the concurrent agent detail lookups
+CLIENT_CONFIG = Config(
+    retries={'mode': 'adaptive', 'max_attempts': 3},
+    read_timeout=300,
+    connect_timeout=10,
+    tcp_keepalive=True,
+    max_pool_connections=32,
+)
+
+# Icon shown next to each agent mode (unknown modes get the server icon)
+MODE_ICONS = {'client': "🔄", 'server': "🌐"}
+
+# A2A URLs are this prefix + the escaped agent ARN + "/invocations/"
+_A2A_URL_PREFIX = f"https://bedrock-agentcore.{REGION}.amazonaws.com/runtimes/"
+
 if not BUILDER_ARN:
     console.print("[bold red]Error: BUILDER_AGENT_ARN environment variable not set[/bold red]")
     console.print("[yellow]Please set it in your .env file after deploying the builder agent[/yellow]")
@@ -61,16 +98,8 @@ if not BUILDER_ARN:
     sys.exit(1)
 
 
-class AgentCoreDemo:
-    def __init__(self):
-        self.client = boto3.client('bedrock-agentcore', region_name=REGION)
-        self.control_client = boto3.client('bedrock-agentcore-control', region_name=REGION)
-        self.current_agent = None
-        self.session_id = None
-        
-    def show_banner(self):
-        """Display welcome banner"""
-        banner = """
+# Static screens, built once: Text skips markup parsing for the banner
+_BANNER = Text("""
 ╔═══════════════════════════════════════════════════════════════╗
 ║                                                               ║
 ║           🤖 AgentCore Factory - Interactive Demo            ║
@@ -79,47 +108,103 @@ class AgentCoreDemo:
 ║  Powered by AWS Bedrock AgentCore Runtime                    ║
 ║                                                               ║
 ╚═══════════════════════════════════════════════════════════════╝
-        """
-        console.print(banner, style="bold blue")
+""", style="bold blue")
+
+_BUILDER_CHAT_PANEL = Panel.fit(
+    "[bold blue]Builder Agent Chat[/bold blue]\n\n"
+    "Ask the builder to create agents for you!\n"
+    "Type 'back' to return to main menu",
+    border_style="blue"
+)
+
+
+class AgentCoreDemo:
+    def __init__(self):
+        # One session for both clients, so credentials are resolved only once
+        self._session = boto3.Session(region_name=REGION)
+        self.client = self._session.client('bedrock-agentcore', config=CLIENT_CONFIG)
+        self.control_client = self._session.client('bedrock-agentcore-control', config=CLIENT_CONFIG)
+        self.current_agent = None
+        self.session_id = None
+        # (time listed, agents) from the last successful list_agents call
+        self._agents_cache: Optional[tuple[float, List[Dict]]] = None
+        # (runtime ID, runtime version) -> invocation mode, see get_invocation_mode
+        self._invocation_modes: Dict[tuple, Dict] = {}
+        
+    def show_banner(self):
+        """Display welcome banner"""
+        console.print(_BANNER)
         console.print()
     
-    def list_agents(self) -> List[Dict]:
-        """List all deployed agents with their invocation mode"""
+    def get_agent_details(self, agent_id: str) -> Dict:
+        """Get an agent's runtime details, or an empty dict if unavailable"""
         try:
-            response = self.control_client.list_agent_runtimes()
+            return self.control_client.get_agent_runtime(agentRuntimeId=agent_id)
+        except Exception:
+            return {}
+    
+    def get_invocation_mode(self, runtime: Dict) -> Dict:
+        """Get an agent's mode and whether to invoke it with JSON-RPC
+        
+        Both are fixed for a runtime version, so they are looked up once per
+        version and remembered.
+        """
+        key = (runtime['agentRuntimeId'], runtime.get('agentRuntimeVersion'))
+        if key in self._invocation_modes:
+            return self._invocation_modes[key]
+        
+        # If we can't get details, details is empty: assume server mode
+        details = self.get_agent_details(runtime['agentRuntimeId'])
+        env_vars = details.get('environmentVariables', {})
+        protocol_config = details.get('protocolConfiguration', {})
+        mode = {
+            'mode': env_vars.get('AGENT_MODE', 'server'),  # Default to server
+            'use_jsonrpc': protocol_config.get('serverProtocol') == 'A2A'  # Use JSON-RPC for A2A server agents
+        }
+        
+        # Only remember real lookups of a known version, not the fallback
+        if details and key[1] is not None:
+            self._invocation_modes[key] = mode
+        return mode
+    
+    def list_agents(self, refresh: bool = False) -> List[Dict]:
+        """List all deployed agents with their invocation mode
+        
+        Results are reused for AGENT_LIST_TTL seconds unless refresh is True.
+        """
+        now = time.monotonic()
+        if not refresh and self._agents_cache and now - self._agents_cache[0] < AGENT_LIST_TTL:
+            return self._agents_cache[1]
+        
+        try:
+            # Follow every page of results, not just the first
+            paginator = self.control_client.get_paginator('list_agent_runtimes')
+            runtimes = [r for page in paginator.paginate() for r in page.get('agentRuntimes', [])]
+            ready = [r for r in runtimes if r.get('status') == 'READY']
+            
+            # Get each agent's mode concurrently (only runtime versions not seen
+            # before need a get_agent_runtime call)
+            with ThreadPoolExecutor(max_workers=MAX_DETAIL_WORKERS) as executor:
+                modes = list(executor.map(self.get_invocation_mode, ready))
+            
             agents = []
-            for runtime in response.get('agentRuntimes', []):
-                if runtime.get('status') == 'READY':
-                    agent_id = runtime['agentRuntimeId']
-                    
-                    # Get agent details to check mode
-                    try:
-                        details = self.control_client.get_agent_runtime(agentRuntimeId=agent_id)
-                        env_vars = details.get('environmentVariables', {})
-                        agent_mode = env_vars.get('AGENT_MODE', 'server')  # Default to server
-                        protocol_config = details.get('protocolConfiguration', {})
-                        has_a2a_protocol = protocol_config.get('serverProtocol') == 'A2A'
-                    except:
-                        # If we can't get details, assume server mode
-                        agent_mode = 'server'
-                        has_a2a_protocol = False
-                    
-                    agents.append({
-                        'id': agent_id,
-                        'name': runtime.get('agentRuntimeName', 'unknown'),
-                        'arn': runtime['agentRuntimeArn'],
-                        'status': runtime['status'],
-                        'mode': agent_mode,
-                        'use_jsonrpc': has_a2a_protocol  # Use JSON-RPC for A2A server agents
-                    })
+            for runtime, mode in zip(ready, modes):
+                agents.append({
+                    'id': runtime['agentRuntimeId'],
+                    'name': runtime.get('agentRuntimeName', 'unknown'),
+                    'arn': runtime['agentRuntimeArn'],
+                    'status': runtime['status'],
+                    **mode
+                })
+            self._agents_cache = (now, agents)
             return agents
         except Exception as e:
             console.print(f"[red]Error listing agents: {e}[/red]")
             return []
     
-    def show_agent_list(self, show_a2a_urls=False):
+    def show_agent_list(self, show_a2a_urls=False, refresh=False):
         """Display table of available agents"""
-        agents = self.list_agents()
+        agents = self.list_agents(refresh=refresh)
         
         table = Table(title="🤖 Available Agents", box=box.ROUNDED, title_style="bold blue")
         table.add_column("#", style="bold blue", width=3)
@@ -132,22 +217,18 @@ class AgentCoreDemo:
             table.add_column("A2A URL", style="dark_blue", overflow="fold")
         
         for idx, agent in enumerate(agents, 1):
-            status_icon = "✅" if agent['status'] == 'READY' else "⏳"
-            mode_icon = "🔄" if agent['mode'] == 'client' else "🌐"
+            mode_icon = MODE_ICONS.get(agent['mode'], "🌐")
             
             row = [
                 str(idx),
                 agent['name'],
                 f"{mode_icon} {agent['mode']}",
-                f"{status_icon} {agent['status']}",
+                f"✅ {agent['status']}",  # list_agents only returns READY agents
                 agent['id']
             ]
             
             if show_a2a_urls:
-                from urllib.parse import quote
-                escaped_arn = quote(agent['arn'], safe='')
-                a2a_url = f"https://bedrock-agentcore.{REGION}.amazonaws.com/runtimes/{escaped_arn}/invocations/"
-                row.append(a2a_url)
+                row.append(_A2A_URL_PREFIX + quote(agent['arn'], safe='') + "/invocations/")
             
             table.add_row(*row)
         
@@ -167,23 +248,28 @@ class AgentCoreDemo:
             # Prepare payload
             payload = {'prompt': message}
             # Session ID must be 33+ characters
-            session_id = f'builder-session-{int(time.time())}-{uuid.uuid4().hex[:12]}'
+            session_id = f'builder-session-{time.monotonic_ns()}-{secrets.token_hex(6)}'
             
             # Invoke builder
             response = self.client.invoke_agent_runtime(
                 agentRuntimeArn=BUILDER_ARN,
                 runtimeSessionId=session_id,
-                payload=json.dumps(payload),
+                payload=_json_dumps(payload),
                 qualifier='DEFAULT'
             )
             
-            # Parse response
-            response_body = response['response'].read().decode('utf-8')
+            # Parse response (the UTF-8 bytes are parsed directly, so the body
+            # is only turned into text when it isn't a JSON result)
+            response_body = response['response'].read()
             try:
-                response_data = json.loads(response_body)
-                result = response_data.get('result', response_body)
-            except:
-                result = response_body
+                response_data = _json_loads(response_body)
+            except ValueError:
+                response_data = None
+            
+            if isinstance(response_data, dict) and 'result' in response_data:
+                result = response_data['result']
+            else:
+                result = response_body.decode('utf-8', 'replace')
             
             progress.update(task, completed=True)
         
@@ -200,7 +286,7 @@ class AgentCoreDemo:
             
             if use_jsonrpc:
                 # JSON-RPC 2.0 format (for A2A server agents)
-                message_id = f'msg-{uuid.uuid4().hex[:8]}'
+                message_id = f'msg-{secrets.token_hex(4)}'
                 payload = {
                     'jsonrpc': '2.0',
                     'method': 'message/send',
@@ -222,29 +308,29 @@ class AgentCoreDemo:
             response = self.client.invoke_agent_runtime(
                 agentRuntimeArn=agent_arn,
                 runtimeSessionId=session_id,
-                payload=json.dumps(payload),
+                payload=_json_dumps(payload),
                 qualifier='DEFAULT'
             )
             
-            # Parse response
-            response_body = response['response'].read().decode('utf-8')
-            response_data = json.loads(response_body)
+            # Parse response (the UTF-8 bytes are parsed directly)
+            response_data = _json_loads(response['response'].read())
             
             # Extract text based on format
             text = ""
             if use_jsonrpc:
-                # JSON-RPC response format
-                if 'result' in response_data and 'artifacts' in response_data['result']:
-                    for artifact in response_data['result']['artifacts']:
-                        if 'parts' in artifact:
-                            for part in artifact['parts']:
-                                if 'text' in part:
-                                    text += part['text']
-                
-                # Check for JSON-RPC errors
+                # Check for JSON-RPC errors first, so error responses skip the artifacts
                 if 'error' in response_data:
                     error = response_data['error']
                     text = f"❌ Error: {error.get('message', 'Unknown error')}\n\nDetails: {json.dumps(error, indent=2)}"
+                
+                # JSON-RPC response format
+                elif 'result' in response_data and 'artifacts' in response_data['result']:
+                    text = "".join([
+                        part['text']
+                        for artifact in response_data['result']['artifacts']
+                        for part in artifact.get('parts', [])
+                        if 'text' in part
+                    ])
             else:
                 # Simple response format
                 text = response_data.get('result', '')
@@ -255,12 +341,7 @@ class AgentCoreDemo:
     
     def chat_with_builder(self):
         """Interactive chat with builder agent"""
-        console.print(Panel.fit(
-            "[bold blue]Builder Agent Chat[/bold blue]\n\n"
-            "Ask the builder to create agents for you!\n"
-            "Type 'back' to return to main menu",
-            border_style="blue"
-        ))
+        console.print(_BUILDER_CHAT_PANEL)
         console.print()
         
         while True:
@@ -275,6 +356,9 @@ class AgentCoreDemo:
             # Send to builder
             response = self.send_to_builder(user_input)
             
+            # The builder may have deployed a new agent
+            self._agents_cache = None
+            
             # Display response
             console.print()
             console.print(Panel(
@@ -302,7 +386,7 @@ class AgentCoreDemo:
         console.print()
         
         # Create session for this conversation (must be 33+ characters)
-        session_id = f"demo-session-{int(time.time())}-{uuid.uuid4().hex[:12]}"
+        session_id = f"demo-session-{time.monotonic_ns()}-{secrets.token_hex(6)}"
         
         while True:
             user_input = Prompt.ask("[bold dark_green]You[/bold dark_green]")
@@ -354,19 +438,22 @@ class AgentCoreDemo:
     
     def main_menu(self):
         """Display main menu"""
+        # The menu never changes, so build it once
+        menu = Table(show_header=False, box=box.SIMPLE)
+        menu.add_column(style="bold blue", width=3)
+        menu.add_column(style="black")
+        
+        menu.add_row("1", "💬 Chat with Builder Agent (create new agents)")
+        menu.add_row("2", "🤖 Chat with Deployed Agent")
+        menu.add_row("3", "📋 List All Agents")
+        menu.add_row("4", "🔗 Show A2A URLs (for agent connections)")
+        menu.add_row("5", "🚪 Exit")
+        
+        menu_panel = Panel(menu, title="[bold blue]Main Menu[/bold blue]", border_style="blue")
+        
         while True:
             console.print()
-            menu = Table(show_header=False, box=box.SIMPLE)
-            menu.add_column(style="bold blue", width=3)
-            menu.add_column(style="black")
-            
-            menu.add_row("1", "💬 Chat with Builder Agent (create new agents)")
-            menu.add_row("2", "🤖 Chat with Deployed Agent")
-            menu.add_row("3", "📋 List All Agents")
-            menu.add_row("4", "🔗 Show A2A URLs (for agent connections)")
-            menu.add_row("5", "🚪 Exit")
-            
-            console.print(Panel(menu, title="[bold blue]Main Menu[/bold blue]", border_style="blue"))
+            console.print(menu_panel)
             
             choice = Prompt.ask("[bold blue]Select option[/bold blue]", choices=["1", "2", "3", "4", "5"])
             
@@ -375,7 +462,7 @@ class AgentCoreDemo:
             elif choice == "2":
                 self.select_agent()
             elif choice == "3":
-                self.show_agent_list()
+                self.show_agent_list(refresh=True)
             elif choice == "4":
                 self.show_agent_list(show_a2a_urls=True)
                 console.print("[bold blue]💡 Tip: Copy these URLs to configure A2A connections between agents[/bold blue]")
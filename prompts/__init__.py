@@ -4,6 +4,6 @@ Prompts for AgentCore Factory agents.
 This module contains system prompts and other prompt templates used by agents.
 """
 
-from .builder_agent_prompts import BUILDER_AGENT_SYSTEM_PROMPT
+from .builder_agent_prompts import BUILDER_AGENT_SYSTEM_PROMPT, BUILDER_SYSTEM_BLOCKS
 
-__all__ = ['BUILDER_AGENT_SYSTEM_PROMPT']
+__all__ = ['BUILDER_AGENT_SYSTEM_PROMPT', 'BUILDER_SYSTEM_BLOCKS']
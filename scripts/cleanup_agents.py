@@ -5,28 +5,39 @@ Cleanup script to delete all AgentCore Runtime agents except the builder agent.
 
 import boto3
 import sys
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator
+from botocore.config import Config
 
 REGION = 'us-west-2'
 BUILDER_AGENT_ID = 'builder-cN967nENBt'  # Keep this one
 
+# Number of agents deleted in parallel
+MAX_WORKERS = 16
 
-def list_all_agents() -> List[Dict]:
-    """List all agent runtimes"""
-    client = boto3.client('bedrock-agentcore-control', region_name=REGION)
-    
+# One client shared by all deletions (boto3 clients are thread-safe), with
+# adaptive retries so parallel deletions back off when throttled
+client = boto3.client(
+    'bedrock-agentcore-control',
+    region_name=REGION,
+    config=Config(retries={'mode': 'adaptive', 'max_attempts': 10}, max_pool_connections=MAX_WORKERS)
+)
+
+
+def iter_agents_to_delete() -> Iterator[Dict]:
+    """Yield every agent runtime except the builder, page by page"""
     try:
-        response = client.list_agent_runtimes()
-        return response.get('agentRuntimes', [])
+        paginator = client.get_paginator('list_agent_runtimes')
+        for page in paginator.paginate():
+            for agent in page.get('agentRuntimes', []):
+                if agent['agentRuntimeId'] != BUILDER_AGENT_ID:
+                    yield agent
     except Exception as e:
         print(f"❌ Error listing agents: {e}")
-        return []
 
 
 def delete_agent(agent_id: str, agent_name: str) -> bool:
     """Delete a specific agent runtime"""
-    client = boto3.client('bedrock-agentcore-control', region_name=REGION)
-    
     try:
         print(f"🗑️  Deleting agent: {agent_name} ({agent_id})...")
         client.delete_agent_runtime(agentRuntimeId=agent_id)
@@ -43,22 +54,12 @@ def main():
     print("=" * 80)
     print()
     
-    # List all agents
+    # List all agents except the builder agent
     print("📋 Fetching all agents...")
-    agents = list_all_agents()
-    
-    if not agents:
-        print("✅ No agents found")
-        return
-    
-    # Filter out builder agent
-    agents_to_delete = [
-        agent for agent in agents 
-        if agent['agentRuntimeId'] != BUILDER_AGENT_ID
-    ]
+    agents_to_delete = list(iter_agents_to_delete())
     
     if not agents_to_delete:
-        print(f"✅ Only builder agent exists (keeping {BUILDER_AGENT_ID})")
+        print(f"✅ No agents to delete (keeping builder agent {BUILDER_AGENT_ID})")
         return
     
     print(f"\n🔍 Found {len(agents_to_delete)} agent(s) to delete:")
@@ -79,18 +80,20 @@ def main():
     
     print()
     
-    # Delete agents
+    # Delete agents in parallel
     deleted_count = 0
     failed_count = 0
     
-    for agent in agents_to_delete:
-        agent_id = agent['agentRuntimeId']
-        agent_name = agent.get('agentRuntimeName', 'unknown')
-        
-        if delete_agent(agent_id, agent_name):
-            deleted_count += 1
-        else:
-            failed_count += 1
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(delete_agent, agent['agentRuntimeId'], agent.get('agentRuntimeName', 'unknown'))
+            for agent in agents_to_delete
+        ]
+        for future in as_completed(futures):
+            if future.result():
+                deleted_count += 1
+            else:
+                failed_count += 1
     
     # Summary
     print()
@@ -6,103 +6,118 @@ Cleanup script to delete all AgentCore Gateways and their Lambda targets.
 import boto3
 import sys
 import time
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional
+from botocore.config import Config
 
 REGION = 'us-west-2'
 
+# Number of gateways deleted in parallel, and of targets per gateway
+MAX_WORKERS = 16
+TARGET_WORKERS = 8
+
+# How long to wait for a gateway's targets to disappear (polls x seconds)
+TARGET_DELETE_POLLS = 10
+TARGET_DELETE_POLL_INTERVAL = 0.5
+
+# One client shared by all deletions (boto3 clients are thread-safe), with
+# adaptive retries so parallel deletions back off when throttled
+client = boto3.client(
+    'bedrock-agentcore-control',
+    region_name=REGION,
+    config=Config(retries={'mode': 'adaptive', 'max_attempts': 10}, max_pool_connections=MAX_WORKERS * TARGET_WORKERS)
+)
+
 
 def list_all_gateways() -> List[Dict]:
     """List all gateways with pagination support"""
-    client = boto3.client('bedrock-agentcore-control', region_name=REGION)
-    
     try:
-        all_gateways = []
-        next_token = None
-        
-        while True:
-            if next_token:
-                response = client.list_gateways(nextToken=next_token)
-            else:
-                response = client.list_gateways()
-            
-            # API returns 'items' not 'gateways'
-            gateways = response.get('items', [])
-            all_gateways.extend(gateways)
-            
-            next_token = response.get('nextToken')
-            if not next_token:
-                break
-        
-        return all_gateways
+        # API returns 'items' not 'gateways'
+        paginator = client.get_paginator('list_gateways')
+        return [gateway for page in paginator.paginate() for gateway in page.get('items', [])]
     except Exception as e:
         print(f"❌ Error listing gateways: {e}")
         return []
 
 
-def list_gateway_targets(gateway_id: str) -> List[Dict]:
-    """List all targets for a gateway with pagination support"""
-    client = boto3.client('bedrock-agentcore-control', region_name=REGION)
+def list_gateway_targets(gateway_id: str, raise_errors: bool = False) -> List[Dict]:
+    """
+    List all targets for a gateway with pagination support.
     
+    Errors are printed and give an empty list, unless raise_errors is set:
+    then they are raised, so an error is not mistaken for "no targets".
+    """
     try:
-        all_targets = []
-        next_token = None
-        
-        while True:
-            if next_token:
-                response = client.list_gateway_targets(gatewayIdentifier=gateway_id, nextToken=next_token)
-            else:
-                response = client.list_gateway_targets(gatewayIdentifier=gateway_id)
-            
-            # API returns 'items' not 'gatewayTargets'
-            targets = response.get('items', response.get('gatewayTargets', []))
-            all_targets.extend(targets)
-            
-            next_token = response.get('nextToken')
-            if not next_token:
-                break
-        
-        return all_targets
+        # API returns 'items' not 'gatewayTargets'
+        paginator = client.get_paginator('list_gateway_targets')
+        return [
+            target
+            for page in paginator.paginate(gatewayIdentifier=gateway_id)
+            for target in page.get('items', page.get('gatewayTargets', []))
+        ]
     except Exception as e:
+        if raise_errors:
+            raise
         print(f"❌ Error listing targets for gateway {gateway_id}: {e}")
         return []
 
 
-def delete_gateway_target(gateway_id: str, target_id: str, target_name: str) -> bool:
-    """Delete a gateway target"""
-    client = boto3.client('bedrock-agentcore-control', region_name=REGION)
+def delete_gateway_target(gateway_id: str, target_id: str) -> Optional[str]:
+    """
+    Delete a gateway target.
+    
+    Nothing is printed here: targets are deleted in parallel, so the caller
+    reports them together once all are done.
     
+    Returns:
+        None if the target was deleted, otherwise the error message
+    """
     try:
-        print(f"  🗑️  Deleting target: {target_name} ({target_id})...")
         client.delete_gateway_target(
             gatewayIdentifier=gateway_id,
             targetId=target_id
         )
-        print(f"  ✅ Deleted target: {target_name}")
-        return True
+        return None
     except Exception as e:
-        print(f"  ❌ Failed to delete target {target_name}: {e}")
-        return False
+        return str(e)
 
 
 def delete_gateway(gateway_id: str, gateway_name: str) -> bool:
     """Delete a gateway and all its targets"""
-    client = boto3.client('bedrock-agentcore-control', region_name=REGION)
-    
     print(f"\n🗑️  Deleting gateway: {gateway_name} ({gateway_id})")
     
     # First, delete all targets
     targets = list_gateway_targets(gateway_id)
     if targets:
-        print(f"  📋 Found {len(targets)} target(s) to delete")
-        for target in targets:
-            target_id = target.get('targetId', target.get('gatewayTargetId', 'unknown'))
-            target_name = target.get('name', target.get('gatewayTargetName', 'unknown'))
-            delete_gateway_target(gateway_id, target_id, target_name)
-            time.sleep(0.5)  # Small delay between deletions
+        with ThreadPoolExecutor(max_workers=TARGET_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    delete_gateway_target,
+                    gateway_id,
+                    target.get('targetId', target.get('gatewayTargetId', 'unknown'))
+                ): target.get('name', target.get('gatewayTargetName', 'unknown'))
+                for target in targets
+            }
+            results = [(futures[future], future.result()) for future in as_completed(futures)]
+        failed = [(name, error) for name, error in results if error]
         
-        # Wait for targets to be fully deleted
-        print(f"  ⏳ Waiting for targets to be fully deleted...")
-        time.sleep(3)
+        # One summary per gateway, printed at once so that gateways deleted in
+        # parallel don't interleave their lines
+        summary = [f"  🗑️  {gateway_name}: deleted {len(targets) - len(failed)}/{len(targets)} target(s)"]
+        summary += [f"  ❌ Failed to delete target {name}: {error}" for name, error in failed]
+        print("\n".join(summary))
+        
+        # Wait for targets to be fully deleted (until none are listed)
+        # A listing error is not "no targets": stop waiting and let the
+        # gateway deletion retries below handle it
+        for _ in range(TARGET_DELETE_POLLS):
+            try:
+                if not list_gateway_targets(gateway_id, raise_errors=True):
+                    break
+            except Exception as e:
+                print(f"  ⚠️  Could not check targets of {gateway_name}: {e}")
+                break
+            time.sleep(TARGET_DELETE_POLL_INTERVAL)
     
     # Then delete the gateway with retries
     max_retries = 3
@@ -154,20 +169,20 @@ def main():
     
     print()
     
-    # Delete gateways
+    # Delete gateways in parallel
     deleted_count = 0
     failed_count = 0
     
-    for gateway in gateways:
-        gateway_id = gateway['gatewayId']
-        gateway_name = gateway.get('name', gateway.get('gatewayName', 'unknown'))
-        
-        if delete_gateway(gateway_id, gateway_name):
-            deleted_count += 1
-        else:
-            failed_count += 1
-        
-        time.sleep(1)  # Delay between gateway deletions
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(delete_gateway, gateway['gatewayId'], gateway.get('name', gateway.get('gatewayName', 'unknown')))
+            for gateway in gateways
+        ]
+        for future in as_completed(futures):
+            if future.result():
+                deleted_count += 1
+            else:
+                failed_count += 1
     
     # Summary
     print()
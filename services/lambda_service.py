@@ -14,9 +14,10 @@ from typing import Dict, List, Any
 from dataclasses import dataclass
 from datetime import datetime
 
-import boto3
 from botocore.exceptions import ClientError
 
+from utils.aws_helpers import get_boto3_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,7 +51,7 @@ class LambdaService:
             region_name: AWS region
         """
         self.region_name = region_name
-        self.lambda_client = boto3.client('lambda', region_name=region_name)
+        self.lambda_client = get_boto3_client('lambda', region_name)
         logger.info(f"LambdaService initialized for region {region_name}")
     
     def create_tool_function(
@@ -68,7 +69,9 @@ class LambdaService:
             function_prefix: Prefix for function name
         
         Returns:
-            Dict with function_arn, function_name, and tool details
+            Dict with function_arn, function_name, tool details, and created
+            (True if a new function was created, False if an existing one
+            was updated)
         
         Raises:
             LambdaServiceError: If function creation fails
@@ -96,6 +99,7 @@ class LambdaService:
                     ZipFile=zip_file
                 )
                 
+                created = False
                 logger.info(f"Updated existing Lambda function: {function_name}")
                 
             except self.lambda_client.exceptions.ResourceNotFoundException:
@@ -118,6 +122,7 @@ class LambdaService:
                     }
                 )
                 
+                created = True
                 logger.info(f"Created new Lambda function: {function_name}")
             
             function_arn = response['FunctionArn']
@@ -127,7 +132,8 @@ class LambdaService:
                 'function_name': function_name,
                 'tool_name': tool_spec.name,
                 'tool_description': tool_spec.description,
-                'input_schema': tool_spec.input_schema
+                'input_schema': tool_spec.input_schema,
+                'created': created
             }
             
         except ClientError as e:
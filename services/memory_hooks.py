@@ -12,6 +12,26 @@ from strands.hooks import AgentInitializedEvent, MessageAddedEvent, HookProvider
 logger = logging.getLogger(__name__)
 
 
+def _system_prompt_blocks(agent) -> list:
+    """
+    Get an agent's system prompt as content blocks.
+    
+    The system_prompt getter returns flattened text, which loses cache points,
+    so the blocks are read from the agent's content representation instead
+    (public from strands-agents 1.40, internal before that).
+    
+    Args:
+        agent: Strands agent
+    
+    Returns:
+        Copy of the system prompt blocks (empty if there is no system prompt)
+    """
+    blocks = getattr(agent, "system_prompt_content", None)
+    if blocks is None:
+        blocks = getattr(agent, "_system_prompt_content", None)
+    return list(blocks or [])
+
+
 class AgentCoreMemoryHook(HookProvider):
     """
     Hook for AgentCore Memory integration.
@@ -57,9 +77,12 @@ class AgentCoreMemoryHook(HookProvider):
                         text = content.get('text', '') if isinstance(content, dict) else str(content)
                         context_lines.append(f"{role}: {text}")
                 
-                # Add to agent's system prompt
+                # Add to agent's system prompt as its own block after the
+                # existing ones, so cache points in the prompt are kept
                 context = "\n".join(context_lines)
-                event.agent.system_prompt += f"\n\nPrevious conversation:\n{context}"
+                event.agent.system_prompt = _system_prompt_blocks(event.agent) + [
+                    {"text": f"Previous conversation:\n{context}"}
+                ]
                 
         except Exception as e:
             logger.warning(f"Failed to load conversation history: {e}")
@@ -1,6 +1,7 @@
 """Utility modules for AgentCore Factory Code Talk."""
 
 from .aws_helpers import (
+    get_boto3_session,
     get_boto3_client,
     authenticate_ecr,
     validate_execution_role,
@@ -20,6 +21,7 @@ from .logging_config import (
 
 __all__ = [
     # AWS helpers
+    "get_boto3_session",
     "get_boto3_client",
     "authenticate_ecr",
     "validate_execution_role",
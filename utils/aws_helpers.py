@@ -7,9 +7,12 @@ including ECR authentication, boto3 client creation, and resource validation.
 import base64
 import logging
 import subprocess
+import threading
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
 logger = logging.getLogger(__name__)
@@ -20,16 +23,61 @@ class AWSHelperError(Exception):
     pass
 
 
+# Clients created by get_boto3_client, keyed by (service name, region name)
+# boto3 clients are thread-safe and can be shared, but sessions are not, so
+# client creation is serialized by a lock
+_client_cache: Dict[tuple, Any] = {}
+_client_lock = threading.Lock()
+
+# Configuration shared by every client from get_boto3_client
+# The pool is sized above the default of 10 so parallel tool creation and
+# deployments don't queue for connections, and adaptive retries back off
+# client-side when AgentCore or Lambda start throttling
+CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={'max_attempts': 5, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+)
+
+
+@lru_cache(maxsize=None)
+def get_boto3_session(region_name: Optional[str] = None) -> boto3.Session:
+    """
+    Get the process-wide boto3 session for a region.
+    
+    Creating a session resolves credentials and loads the endpoint data,
+    so one session per region is created and reused for the lifetime of
+    the process.
+    
+    Args:
+        region_name: AWS region name (defaults to environment or config)
+        
+    Returns:
+        Shared boto3 session
+        
+    Example:
+        >>> session = get_boto3_session('us-west-2')
+        >>> session is get_boto3_session('us-west-2')
+        True
+    """
+    logger.info(f"Creating boto3 session for region: {region_name or 'default'}")
+    return boto3.Session(region_name=region_name)
+
+
 def get_boto3_client(service_name: str, region_name: Optional[str] = None) -> Any:
     """
-    Create a boto3 client with error handling.
+    Get a boto3 client with error handling.
+    
+    Clients are created from the shared session for the region (see
+    get_boto3_session) with CLIENT_CONFIG and cached, so each service/region
+    pair is set up only once per process.
     
     Args:
         service_name: AWS service name (e.g., 'ecr', 'sts', 'bedrock-agent-runtime')
         region_name: AWS region name (defaults to environment or config)
         
     Returns:
-        Configured boto3 client
+        Configured boto3 client (shared, do not close)
         
     Raises:
         AWSHelperError: If client creation fails
@@ -38,15 +86,20 @@ def get_boto3_client(service_name: str, region_name: Optional[str] = None) -> An
         >>> ecr_client = get_boto3_client('ecr', 'us-west-2')
         >>> sts_client = get_boto3_client('sts')
     """
+    cache_key = (service_name, region_name)
+    client = _client_cache.get(cache_key)
+    if client is not None:
+        return client
+    
     try:
-        logger.info(f"Creating boto3 client for service: {service_name}, region: {region_name or 'default'}")
+        with _client_lock:
+            client = _client_cache.get(cache_key)
+            if client is None:
+                logger.info(f"Creating boto3 client for service: {service_name}, region: {region_name or 'default'}")
+                client = get_boto3_session(region_name).client(service_name, config=CLIENT_CONFIG)
+                _client_cache[cache_key] = client
+                logger.debug(f"Successfully created {service_name} client")
         
-        if region_name:
-            client = boto3.client(service_name, region_name=region_name)
-        else:
-            client = boto3.client(service_name)
-            
-        logger.debug(f"Successfully created {service_name} client")
         return client
         
     except NoCredentialsError as e:
@@ -68,10 +121,14 @@ def get_boto3_client(service_name: str, region_name: Optional[str] = None) -> An
         raise AWSHelperError(error_msg) from e
 
 
+@lru_cache(maxsize=1)
 def get_account_id() -> str:
     """
     Get the AWS account ID using STS.
     
+    The account never changes while the process runs, so STS is called only
+    once; later calls return the cached ID.
+    
     Returns:
         AWS account ID as string
         
@@ -0,0 +1,69 @@
+"""Once-per-session guards for the Builder Agent tools.
+
+Some tools (creating a gateway, deploying an agent) must run at most once
+per builder invocation, even if the model calls them again. This module
+records which of those actions have completed in the current invocation
+and builds the "duplicate blocked" response when one is attempted again.
+"""
+
+import logging
+from contextvars import ContextVar
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Action key -> details of the completed action, for the current invocation
+# A ContextVar keeps concurrent invocations apart: the builder agent starts a
+# fresh record in each invocation's own context (reset_session_actions), and
+# the tool threads of that invocation share it
+_completed_actions: ContextVar[Optional[dict]] = ContextVar('completed_actions', default=None)
+
+
+def reset_session_actions() -> None:
+    """Start a fresh record of completed actions for the current invocation."""
+    _completed_actions.set({})
+
+
+def _get_completed_actions() -> dict:
+    """Get the completed actions of the current invocation."""
+    if _completed_actions.get() is None:
+        reset_session_actions()
+    return _completed_actions.get()
+
+
+def once_per_session(key: str, duplicate_template: str) -> Optional[str]:
+    """
+    Check whether an action has already completed in this session.
+
+    Args:
+        key: Action key (e.g., 'gateway', 'deployment')
+        duplicate_template: Response template, formatted with the details
+            recorded by mark_session_action
+
+    Returns:
+        The formatted duplicate response if the action already completed,
+        otherwise None
+
+    Example:
+        >>> blocked = once_per_session('gateway', _DUPLICATE_GATEWAY_TEMPLATE)
+        >>> if blocked:
+        ...     return blocked
+    """
+    details = _get_completed_actions().get(key)
+    if details is None:
+        return None
+
+    logger.warning(f"⚠️  Attempted duplicate {key} blocked: {details}")
+    return duplicate_template.format(**details)
+
+
+def mark_session_action(key: str, **details: str) -> None:
+    """
+    Record that an action completed in this session.
+
+    Args:
+        key: Action key (e.g., 'gateway', 'deployment')
+        **details: Values for the action's duplicate response template
+    """
+    _get_completed_actions()[key] = details
+    logger.info(f"✅ Recorded {key} for this session: {details}")
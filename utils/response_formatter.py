@@ -4,6 +4,55 @@ Response Formatter for Builder Agent
 Provides clean, readable formatting for agent responses in demos and presentations.
 """
 
+_SEPARATOR = "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+
+# Response templates, filled in with str.format
+_DEPLOYMENT_SUCCESS_TEMPLATE = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        ✅ AGENT DEPLOYED SUCCESSFULLY                        ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+🤖 Agent: {name}
+📋 Purpose: {purpose}
+🆔 Agent ID: {agent_id}
+⚡ Status: {status}
+
+🎯 Capabilities: {caps_str}
+🛠️  Tools: {tools_str}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+The agent is ready to use! Invoke it with:
+
+  Agent ARN: {agent_arn}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+""".strip()
+
+_DEPLOYMENT_ERROR_HEADER = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                          ❌ DEPLOYMENT FAILED                                ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Error: {error_type}
+
+{error_message}
+"""
+
+_AGENT_UPDATE_TEMPLATE = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         ✅ AGENT UPDATED SUCCESSFULLY                        ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+🤖 Agent: {name}
+🆔 Agent ID: {agent_id}
+⚡ Status: {status}
+
+The existing agent has been updated with the new configuration.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+""".strip()
+
 
 def format_deployment_success(
     agent_id: str,
@@ -48,27 +97,15 @@ def format_deployment_success(
     # Format capabilities
     caps_str = ", ".join(capabilities) if capabilities else "General"
     
-    return f"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                        ✅ AGENT DEPLOYED SUCCESSFULLY                        ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-
-🤖 Agent: {name}
-📋 Purpose: {purpose}
-🆔 Agent ID: {agent_id}
-⚡ Status: {status}
-
-🎯 Capabilities: {caps_str}
-🛠️  Tools: {tools_str}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-The agent is ready to use! Invoke it with:
-
-  Agent ARN: {agent_arn}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-""".strip()
+    return _DEPLOYMENT_SUCCESS_TEMPLATE.format(
+        name=name,
+        purpose=purpose,
+        agent_id=agent_id,
+        status=status,
+        caps_str=caps_str,
+        tools_str=tools_str,
+        agent_arn=agent_arn,
+    )
 
 
 def format_deployment_error(error_type: str, error_message: str, suggestions: list[str] = None) -> str:
@@ -84,25 +121,15 @@ def format_deployment_error(error_type: str, error_message: str, suggestions: li
         Formatted error message
     """
     
-    result = f"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                          ❌ DEPLOYMENT FAILED                                ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-
-Error: {error_type}
-
-{error_message}
-"""
+    parts = [_DEPLOYMENT_ERROR_HEADER.format(error_type=error_type, error_message=error_message)]
     
     if suggestions:
-        result += "\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        result += "\n💡 Suggestions:\n"
-        for i, suggestion in enumerate(suggestions, 1):
-            result += f"  {i}. {suggestion}\n"
+        parts.append(f"\n{_SEPARATOR}\n\n💡 Suggestions:\n")
+        parts.extend(f"  {i}. {suggestion}\n" for i, suggestion in enumerate(suggestions, 1))
     
-    result += "\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+    parts.append(f"\n{_SEPARATOR}")
     
-    return result.strip()
+    return "".join(parts).strip()
 
 
 def format_agent_update(agent_id: str, name: str, status: str = "UPDATED") -> str:
@@ -118,16 +145,4 @@ def format_agent_update(agent_id: str, name: str, status: str = "UPDATED") -> st
         Formatted update message
     """
     
-    return f"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                         ✅ AGENT UPDATED SUCCESSFULLY                        ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-
-🤖 Agent: {name}
-🆔 Agent ID: {agent_id}
-⚡ Status: {status}
-
-The existing agent has been updated with the new configuration.
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-""".strip()
+    return _AGENT_UPDATE_TEMPLATE.format(agent_id=agent_id, name=name, status=status)
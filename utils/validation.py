@@ -11,6 +11,17 @@ from typing import Dict, List, Optional, Any
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by the sanitizers and validators, compiled once at import
+_NON_AWS_NAME_CHARS = re.compile(r'[^a-z0-9-]')
+_NON_MEMORY_NAME_CHARS = re.compile(r'[^a-z0-9_]')
+_NON_ALPHANUMERIC = re.compile(r'[^a-zA-Z0-9]')
+_NON_ALPHANUMERIC_OR_HYPHEN = re.compile(r'[^a-zA-Z0-9\-]')
+_HYPHEN_RUN = re.compile(r'-+')
+_UNDERSCORE_RUN = re.compile(r'_+')
+_AGENT_NAME = re.compile(r'^[a-zA-Z0-9-]+$')
+# Basic ARN format: arn:partition:service:region:account-id:resource
+_ARN = re.compile(r'^arn:aws[a-z-]*:[a-z0-9-]+:[a-z0-9-]*:\d{12}:.+$')
+
 
 class ValidationError(Exception):
     """Base exception for validation errors."""
@@ -47,10 +58,10 @@ def sanitize_aws_name(name: str, max_length: int = 63) -> str:
     sanitized = sanitized.replace(' ', '-').replace('_', '-')
     
     # Remove any characters that aren't alphanumeric or hyphens
-    sanitized = re.sub(r'[^a-z0-9-]', '', sanitized)
+    sanitized = _NON_AWS_NAME_CHARS.sub('', sanitized)
     
     # Remove consecutive hyphens
-    sanitized = re.sub(r'-+', '-', sanitized)
+    sanitized = _HYPHEN_RUN.sub('-', sanitized)
     
     # Ensure it starts with a letter
     if sanitized and not sanitized[0].isalpha():
@@ -100,10 +111,10 @@ def sanitize_memory_name(name: str, max_length: int = 48) -> str:
     sanitized = sanitized.replace(' ', '_').replace('-', '_')
     
     # Remove any characters that aren't alphanumeric or underscores
-    sanitized = re.sub(r'[^a-z0-9_]', '', sanitized)
+    sanitized = _NON_MEMORY_NAME_CHARS.sub('', sanitized)
     
     # Remove consecutive underscores
-    sanitized = re.sub(r'_+', '_', sanitized)
+    sanitized = _UNDERSCORE_RUN.sub('_', sanitized)
     
     # Ensure it starts with a letter
     if sanitized and not sanitized[0].isalpha():
@@ -147,10 +158,10 @@ def sanitize_runtime_name(name: str, max_length: int = 48) -> str:
         'agent_123_agent'
     """
     # Replace non-alphanumeric with underscore
-    sanitized = re.sub(r'[^a-zA-Z0-9]', '_', name)
+    sanitized = _NON_ALPHANUMERIC.sub('_', name)
     
     # Collapse multiple underscores
-    sanitized = re.sub(r'_+', '_', sanitized)
+    sanitized = _UNDERSCORE_RUN.sub('_', sanitized)
     
     # Remove leading/trailing underscores
     sanitized = sanitized.strip('_')
@@ -195,10 +206,10 @@ def sanitize_gateway_name(name: str, max_length: int = 48) -> str:
         'gw-123-gateway'
     """
     # Replace non-alphanumeric (except hyphens) with hyphens
-    sanitized = re.sub(r'[^a-zA-Z0-9\-]', '-', name)
+    sanitized = _NON_ALPHANUMERIC_OR_HYPHEN.sub('-', name)
     
     # Collapse multiple hyphens
-    sanitized = re.sub(r'-+', '-', sanitized)
+    sanitized = _HYPHEN_RUN.sub('-', sanitized)
     
     # Remove leading/trailing hyphens
     sanitized = sanitized.strip('-')
@@ -242,10 +253,10 @@ def sanitize_gateway_target_name(name: str, max_length: int = 100) -> str:
         'Get-User-Info'
     """
     # Replace non-alphanumeric (except hyphens) with hyphens
-    sanitized = re.sub(r'[^a-zA-Z0-9\-]', '-', name)
+    sanitized = _NON_ALPHANUMERIC_OR_HYPHEN.sub('-', name)
     
     # Collapse multiple hyphens
-    sanitized = re.sub(r'-+', '-', sanitized)
+    sanitized = _HYPHEN_RUN.sub('-', sanitized)
     
     # Remove leading/trailing hyphens
     sanitized = sanitized.strip('-')
@@ -318,8 +329,8 @@ def validate_agent_name(name: str, min_length: int = 1, max_length: int = 63) ->
         raise ValidationError("Agent name cannot end with a hyphen")
     
     # Check for valid characters (alphanumeric and hyphens only)
-    if not re.match(r'^[a-zA-Z0-9-]+$', name):
-        invalid_chars = set(re.findall(r'[^a-zA-Z0-9-]', name))
+    if not _AGENT_NAME.match(name):
+        invalid_chars = set(_NON_ALPHANUMERIC_OR_HYPHEN.findall(name))
         raise ValidationError(
             f"Agent name contains invalid characters: {', '.join(invalid_chars)}. "
             f"Only alphanumeric characters and hyphens are allowed."
@@ -489,10 +500,7 @@ def validate_arn(arn: str, resource_type: Optional[str] = None) -> bool:
     if not arn:
         raise ValidationError("ARN cannot be empty")
     
-    # Basic ARN format: arn:partition:service:region:account-id:resource
-    arn_pattern = r'^arn:aws[a-z-]*:[a-z0-9-]+:[a-z0-9-]*:\d{12}:.+$'
-    
-    if not re.match(arn_pattern, arn):
+    if not _ARN.match(arn):
         raise ValidationError(
             f"Invalid ARN format: {arn}. "
             f"Expected format: arn:aws:service:region:account-id:resource"